@@ -19,6 +19,8 @@ class DynamicArray:
     append, pop, swap, get_at_index, set_at_index, length
     """
 
+    __slots__ = ('_data',)
+
     def __init__(self, arr=None) -> None:
         """Initialize new dynamic array using a list."""
         self._data = arr.copy() if arr else []
@@ -103,11 +105,18 @@ class SLNode:
     Singly Linked List node for use in a hash map
     """
 
-    def __init__(self, key: str, value: object, next: "SLNode" = None) -> None:
-        """Initialize node given a key and value."""
+    __slots__ = ('key', 'value', 'next', 'hash')
+
+    def __init__(self, key: str, value: object, next: "SLNode" = None,
+                 hash: int = None) -> None:
+        """
+        Initialize node given a key and value.
+        The key's full hash code can be cached so the map never re-hashes it.
+        """
         self.key = key
         self.value = value
         self.next = next
+        self.hash = hash
 
     def __str__(self) -> str:
         """Override string method to provide more readable output."""
@@ -119,6 +128,8 @@ class LinkedListIterator:
     Separate iterator class for LinkedList
     """
 
+    __slots__ = ('_node',)
+
     def __init__(self, current_node: SLNode) -> None:
         """Initialize the iterator with a node."""
         self._node = current_node
@@ -141,9 +152,11 @@ class LinkedListIterator:
 class LinkedList:
     """
     Class implementing a Singly Linked List
-    Supported methods are: insert, remove, contains, length, iterator
+    Supported methods are: insert, remove, pop, contains, length, iterator
     """
 
+    __slots__ = ('_head', '_size')
+
     def __init__(self) -> None:
         """
         Initialize new linked list;
@@ -168,37 +181,63 @@ class LinkedList:
         """Return an iterator for the list, starting at the head."""
         return LinkedListIterator(self._head)
 
-    def insert(self, key: str, value: object) -> None:
+    def insert(self, key: str, value: object, hash: int = None) -> None:
         """Insert new node at front of the list."""
-        self._head = SLNode(key, value, self._head)
+        self._head = SLNode(key, value, self._head, hash)
         self._size += 1
 
-    def remove(self, key: str) -> bool:
+    def remove(self, key: str, hash: int = None) -> bool:
         """
         Remove first node with matching key.
+        If a hash is given, nodes with a different cached hash are skipped
+        without comparing keys.
         Return True if removal was successful, False otherwise.
         """
+        return self.pop(key, hash) is not None
+
+    def pop(self, key: str, hash: int = None) -> SLNode:
+        """
+        Unlink first node with matching key in a single traversal.
+        If a hash is given, nodes with a different cached hash are skipped
+        without comparing keys.
+        Return the removed node, or None if no match.
+        """
         previous, node = None, self._head
         while node:
 
-            if node.key == key:
+            if (hash is None or node.hash == hash) and node.key == key:
                 if previous:
                     previous.next = node.next
                 else:
                     self._head = node.next
                 self._size -= 1
-                return True
+                return node
 
             previous, node = node, node.next
-        return False
+        return None
 
-    def contains(self, key: str) -> SLNode:
-        """Return node with matching key, or None if no match"""
+    def contains(self, key: str, hash: int = None, record=None) -> SLNode:
+        """
+        Return node with matching key, or None if no match.
+        If a hash is given, nodes with a different cached hash are skipped
+        without comparing keys. If record is given, it is called with the
+        number of nodes examined.
+        """
         node = self._head
+        if record is None:
+            while node:
+                if (hash is None or node.hash == hash) and node.key == key:
+                    return node
+                node = node.next
+            return node
+
+        probes = 0
         while node:
-            if node.key == key:
-                return node
+            probes += 1
+            if (hash is None or node.hash == hash) and node.key == key:
+                break
             node = node.next
+        record(probes)
         return node
 
     def length(self) -> int:
@@ -210,10 +249,18 @@ class LinkedList:
 
 class HashEntry:
 
-    def __init__(self, key: str, value: object) -> None:
-        """Initialize an entry for use in a hash map."""
+    __slots__ = ('key', 'value', 'hash', 'step', 'is_tombstone')
+
+    def __init__(self, key: str, value: object, hash: int = None, step: int = None) -> None:
+        """
+        Initialize an entry for use in a hash map.
+        The key's full hash code, and the step of its probe sequence if the probing strategy needs
+        one, can be cached so the map never re-hashes it.
+        """
         self.key = key
         self.value = value
+        self.hash = hash
+        self.step = step
         self.is_tombstone = False
 
     def __str__(self) -> str:
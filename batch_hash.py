@@ -0,0 +1,76 @@
+# Description: Hash whole sequences of keys in one call. hash_function_1 and
+#              hash_function_2 are vectorized with NumPy over the keys' code
+#              points when it is installed; any other hash function, or a
+#              missing NumPy, falls back to calling the function per key.
+#              Results always match the scalar hash functions exactly.
+
+from a6_include import hash_function_1, hash_function_2
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Longest key the vectorized path handles; position-weighted sums of longer keys
+# could overflow 64-bit integers, so those batches are hashed one key at a time.
+MAX_VECTOR_KEY_LENGTH = 2 ** 20
+
+
+def _code_points(keys: list):
+    """
+    Return the code points of all keys concatenated, the offset each key starts at and each key's
+    length, as NumPy arrays.
+    """
+    lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+
+    # surrogatepass keeps lone surrogates, which the scalar hash functions accept, as code points
+    codes = np.frombuffer(''.join(keys).encode('utf-32-le', 'surrogatepass'),
+                          dtype=np.uint32).astype(np.int64)
+    starts = np.zeros(len(keys), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    return codes, starts, lengths
+
+
+def _segment_sums(values, starts, lengths):
+    """Return the sum of values over each key's segment, with 0 for empty keys."""
+    # reduceat needs every start to be a valid index, so pad with a trailing zero
+    sums = np.add.reduceat(np.append(values, 0), starts)
+    sums[lengths == 0] = 0
+    return sums
+
+
+def _vector_hashes(keys: list, function):
+    """Return hash codes of keys as a NumPy array, or None if function can't be vectorized."""
+    if np is None or not keys or function not in (hash_function_1, hash_function_2):
+        return None
+    if not all(type(key) is str for key in keys):
+        return None
+
+    codes, starts, lengths = _code_points(keys)
+    if lengths.max() > MAX_VECTOR_KEY_LENGTH:
+        return None
+
+    if function is hash_function_1:
+        return _segment_sums(codes, starts, lengths)
+
+    # hash_function_2 weights each code point by its 1-based position within its key
+    positions = np.arange(codes.size, dtype=np.int64) - np.repeat(starts, lengths) + 1
+    return _segment_sums(codes * positions, starts, lengths)
+
+
+def hash_many(keys, function) -> list:
+    """Return a list with the hash code of each key, as computed by function."""
+    keys = list(keys)
+    hashes = _vector_hashes(keys, function)
+    if hashes is None:
+        return [function(key) for key in keys]
+    return hashes.tolist()
+
+
+def bucket_indices(keys, function, capacity: int) -> list:
+    """Return a list with the bucket index of each key in a table of the given capacity."""
+    keys = list(keys)
+    hashes = _vector_hashes(keys, function)
+    if hashes is None:
+        return [function(key) % capacity for key in keys]
+    return (hashes % capacity).tolist()
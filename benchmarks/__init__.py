@@ -0,0 +1,3 @@
+# Description: Benchmarks for the HashMap implementations.
+#              Run a benchmark from the repository root, e.g.
+#              python -m benchmarks.bench_resize
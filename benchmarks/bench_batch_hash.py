@@ -0,0 +1,36 @@
+# Description: Compare keys hashed per second by batch_hash.hash_many against
+#              calling hash_function_1 / hash_function_2 once per key.
+
+import argparse
+import time
+
+import batch_hash
+from a6_include import hash_function_1, hash_function_2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark batch key hashing.')
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--key-length', type=int, default=16)
+    args = parser.parse_args()
+
+    padding = 'k' * max(0, args.key_length - 7)
+    keys = [padding + str(i) for i in range(args.count)]
+    print(f"NumPy available: {batch_hash.np is not None}")
+    print(f"{'function':<16} {'scalar keys/s':>14} {'batch keys/s':>13} {'speedup':>8}")
+    for function in (hash_function_1, hash_function_2):
+        start = time.perf_counter()
+        scalar = [function(key) for key in keys]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = batch_hash.hash_many(keys, function)
+        batch_time = time.perf_counter() - start
+
+        assert batch == scalar
+        print(f"{function.__name__:<16} {args.count / scalar_time:>14.0f} {args.count / batch_time:>13.0f} "
+              f"{scalar_time / batch_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
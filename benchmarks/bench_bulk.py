@@ -0,0 +1,56 @@
+# Description: Compare put_many / get_many / remove_many against calling put,
+#              get and remove once per key, for both maps.
+
+import argparse
+import time
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import hash_function_2
+from hash_functions import native_hash
+
+
+def timed(operation) -> float:
+    """Return seconds taken by operation()."""
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def per_key(module, function, pairs: list, keys: list) -> (float, float, float):
+    """Return put, get and remove seconds using one call per key."""
+    m = module.HashMap(16, function)
+    put = timed(lambda: [m.put(key, value) for key, value in pairs])
+    get = timed(lambda: [m.get(key) for key in keys])
+    remove = timed(lambda: [m.remove(key) for key in keys])
+    return put, get, remove
+
+
+def batched(module, function, pairs: list, keys: list) -> (float, float, float):
+    """Return put, get and remove seconds using the bulk operations."""
+    m = module.HashMap(16, function)
+    put = timed(lambda: m.put_many(pairs))
+    get = timed(lambda: m.get_many(keys))
+    remove = timed(lambda: m.remove_many(keys))
+    return put, get, remove
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark bulk map operations.')
+    parser.add_argument('--count', type=int, default=100_000)
+    args = parser.parse_args()
+
+    pairs = [('key' + str(i), i) for i in range(args.count)]
+    keys = [key for key, _ in pairs]
+    print(f"{'map':<4} {'function':<16} {'op':<7} {'per key (s)':>12} {'bulk (s)':>9} {'speedup':>8}")
+    for module in (hash_map_sc, hash_map_oa):
+        for function in (hash_function_2, native_hash):
+            before = per_key(module, function, pairs, keys)
+            after = batched(module, function, pairs, keys)
+            name = module.__name__.split('_')[-1]
+            for op, b, a in zip(('put', 'get', 'remove'), before, after):
+                print(f"{name:<4} {function.__name__:<16} {op:<7} {b:>12.3f} {a:>9.3f} {b / a:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Description: Measure the hit-path latency of LRUCache.get against a raw
+#              HashMap.get on the same keys, for a plain LRU cache and with
+#              TTL expiry and a byte limit enabled, on both map classes.
+
+import argparse
+import random
+import time
+
+import hash_map_oa
+import hash_map_sc
+from cache import LRUCache
+
+HASH_FUNCTION = hash
+
+
+def per_get(get, keys: list) -> float:
+    """Return mean seconds per call of get over keys."""
+    start = time.perf_counter()
+    for key in keys:
+        get(key)
+    return (time.perf_counter() - start) / len(keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark LRUCache hit latency against HashMap.get.')
+    parser.add_argument('--keys', type=int, default=100_000)
+    parser.add_argument('--lookups', type=int, default=500_000)
+    args = parser.parse_args()
+
+    keys = ['key' + str(i) for i in range(args.keys)]
+    rnd = random.Random(0)
+    lookups = [rnd.choice(keys) for _ in range(args.lookups)]
+
+    print(f"{'map':<12} {'variant':<16} {'get':>10} {'overhead':>10}")
+    for module in (hash_map_sc, hash_map_oa):
+        m = module.HashMap(64, HASH_FUNCTION)
+        for i, key in enumerate(keys):
+            m.put(key, i)
+        raw = per_get(m.get, lookups)
+        print(f"{module.__name__:<12} {'raw HashMap':<16} {raw * 1e9:>7.0f} ns")
+
+        variants = [('lru', {'max_entries': args.keys}),
+                    ('lru + ttl', {'max_entries': args.keys, 'ttl': 3600}),
+                    ('lru + max_bytes', {'max_bytes': 2 ** 40})]
+        for name, options in variants:
+            cache = LRUCache(function=HASH_FUNCTION, map_class=module.HashMap, **options)
+            for i, key in enumerate(keys):
+                cache.put(key, i)
+            hit = per_get(cache.get, lookups)
+            assert cache.misses == 0
+            print(f"{module.__name__:<12} {name:<16} {hit * 1e9:>7.0f} ns {hit / raw:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
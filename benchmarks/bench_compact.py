@@ -0,0 +1,51 @@
+# Description: Compare memory per entry and throughput of the open addressing
+#              map (one HashEntry object per slot) against the compact layout
+#              (sparse index plus dense parallel arrays).
+
+import argparse
+import time
+
+import hash_map_compact
+import hash_map_oa
+from benchmarks.bench_memory import bytes_per_entry
+
+# Python's own hash keeps this benchmark about storage layout rather than hash clustering
+HASH_FUNCTION = hash
+
+
+def throughput(module, keys: list) -> (float, float, float):
+    """Return put, get and get_keys operations per second."""
+    m = module.HashMap(16, HASH_FUNCTION)
+    start = time.perf_counter()
+    for key in keys:
+        m.put(key, key)
+    puts = len(keys) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        m.get(key)
+    gets = len(keys) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    m.get_keys()
+    scans = len(keys) / (time.perf_counter() - start)
+    return puts, gets, scans
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the compact open addressing layout.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'map':<8} {'entries':>9} {'bytes/entry':>12} {'put/s':>10} {'get/s':>10} {'keys/s':>12}")
+    for count in args.sizes:
+        keys = ['key' + str(i) for i in range(count)]
+        for module in (hash_map_oa, hash_map_compact):
+            name = module.__name__.split('_')[-1]
+            memory = bytes_per_entry(module, keys)
+            puts, gets, scans = throughput(module, keys)
+            print(f"{name:<8} {count:>9} {memory:>12.1f} {puts:>10.0f} {gets:>10.0f} {scans:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
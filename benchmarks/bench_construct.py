@@ -0,0 +1,45 @@
+# Description: Compare building a map from a known dataset with from_dict /
+#              from_pairs against creating a small map and calling put() for
+#              every pair.
+
+import argparse
+import time
+
+import hash_map_oa
+import hash_map_sc
+from hash_functions import native_hash
+
+
+def timed(operation) -> float:
+    """Return seconds taken by operation()."""
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def put_loop(module, pairs: list):
+    """Return a map built with one put() per pair."""
+    m = module.HashMap(50, native_hash)
+    for key, value in pairs:
+        m.put(key, value)
+    return m
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark presized map construction.')
+    parser.add_argument('--count', type=int, default=500_000)
+    args = parser.parse_args()
+
+    pairs = [('key' + str(i), i) for i in range(args.count)]
+    mapping = dict(pairs)
+    print(f"{'map':<4} {'put loop (s)':>13} {'from_pairs (s)':>15} {'from_dict (s)':>14}")
+    for module in (hash_map_sc, hash_map_oa):
+        loop = timed(lambda: put_loop(module, pairs))
+        from_pairs = timed(lambda: module.HashMap.from_pairs(pairs, native_hash))
+        from_dict = timed(lambda: module.HashMap.from_dict(mapping, native_hash))
+        name = module.__name__.split('_')[-1]
+        print(f"{name:<4} {loop:>13.3f} {from_pairs:>15.3f} {from_dict:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Description: Compare find_mode, which counts with a single HashMap.update per
+#              element, against the previous get-then-put counting loop.
+
+import argparse
+import random
+import time
+
+from a6_include import DynamicArray, hash_function_1
+from hash_map_sc import HashMap, find_mode
+
+
+def find_mode_get_put(da: DynamicArray) -> (DynamicArray, int):
+    """Previous find_mode: a get() and a put() per element."""
+    map = HashMap(da.length() // 3, hash_function_1)
+    mode_array = DynamicArray()
+    mode_frequency = 0
+    for i in range(da.length()):
+        current_frequency = map.get(da[i])
+        if current_frequency is None:
+            current_frequency = 1
+        else:
+            current_frequency += 1
+        map.put(da[i], current_frequency)
+
+        if current_frequency > mode_frequency:
+            mode_array = DynamicArray()
+            mode_array.append(da[i])
+            mode_frequency = current_frequency
+        elif current_frequency == mode_frequency:
+            mode_array.append(da[i])
+    return mode_array, mode_frequency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark find_mode counting.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--distinct', type=int, default=5_000)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    print(f"{'elements':>9} {'get + put (s)':>14} {'update (s)':>11} {'speedup':>8}")
+    for count in args.sizes:
+        da = DynamicArray([str(rnd.randrange(args.distinct)) for _ in range(count)])
+
+        start = time.perf_counter()
+        expected = find_mode_get_put(da)
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = find_mode(da)
+        after = time.perf_counter() - start
+
+        assert str(result[0]) == str(expected[0]) and result[1] == expected[1]
+        print(f"{count:>9} {before:>14.3f} {after:>11.3f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
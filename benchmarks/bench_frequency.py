@@ -0,0 +1,53 @@
+# Description: Measure frequency counting throughput over a generated stream,
+#              counting in-process with FrequencyCounter and across process
+#              pools of increasing size with count_parallel. Worker counts
+#              above the CPU count cannot show scaling; so far it has only
+#              been run on one CPU, where extra workers only add overhead.
+
+import argparse
+import os
+import random
+import time
+
+from frequency import FrequencyCounter, count_parallel
+
+
+def generate(count: int, distinct: int, seed: int = 0):
+    """Yield count values drawn from a Zipf-like distribution over distinct values."""
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield 'v' + str(min(int(rnd.paretovariate(1.1)), distinct))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark streaming frequency counting.')
+    parser.add_argument('--count', type=int, default=2_000_000)
+    parser.add_argument('--distinct', type=int, default=100_000)
+    parser.add_argument('--chunk-size', type=int, default=65_536)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    # Materialize the stream once so generating values isn't part of the measurement
+    values = list(generate(args.count, args.distinct))
+
+    cpus = os.cpu_count() or 1
+    print(f"{cpus} CPUs")
+    if max(args.workers) > cpus:
+        print(f"more workers than CPUs: counts above {cpus} measure overhead, not scaling")
+
+    start = time.perf_counter()
+    expected = FrequencyCounter().consume(values, args.chunk_size)
+    elapsed = time.perf_counter() - start
+    print(f"{'in-process':<12} {args.count / elapsed:>12.0f} values/s")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        counter = count_parallel(values, workers, args.chunk_size)
+        elapsed = time.perf_counter() - start
+        assert counter.top_k(10) == expected.top_k(10)
+        print(f"{str(workers) + ' workers':<12} {args.count / elapsed:>12.0f} values/s")
+
+
+if __name__ == "__main__":
+    main()
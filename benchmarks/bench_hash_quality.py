@@ -0,0 +1,71 @@
+# Description: Measure distribution quality and speed of each hash function
+#              across several realistic key sets: bucket occupancy variance
+#              and longest chain in a separate chaining table, longest probe
+#              sequence in an open addressing table, and keys hashed per second.
+
+import argparse
+import itertools
+import random
+import time
+
+from a6_include import hash_function_1, hash_function_2
+from hash_functions import fnv1a_64, mix_hash, native_hash
+from hash_map_oa import HashMap
+from benchmarks.bench_probing import probe_count
+
+FUNCTIONS = (hash_function_1, hash_function_2, fnv1a_64, mix_hash, native_hash)
+
+
+def key_sets(count: int, seed: int = 0) -> dict:
+    """Return named lists of count keys each."""
+    rnd = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    anagrams = [''.join(p) for p in itertools.islice(itertools.permutations('abcdefghij'), count)]
+    return {
+        'sequential': ['str' + str(i) for i in range(count)],
+        'anagrams': anagrams,
+        'words': [''.join(rnd.choice(letters) for _ in range(rnd.randint(3, 12))) for _ in range(count)],
+        'numeric': [str(rnd.randrange(10 ** 12)) for _ in range(count)],
+        'paths': ['/api/v1/users/' + str(i) + '/orders/' + str(i % 97) for i in range(count)],
+    }
+
+
+def occupancy(keys: list, function, capacity: int) -> (float, int):
+    """Return variance of keys per bucket and the longest chain for a chaining table."""
+    counts = [0] * capacity
+    for key in keys:
+        counts[function(key) % capacity] += 1
+    mean = len(keys) / capacity
+    variance = sum((c - mean) ** 2 for c in counts) / capacity
+    return variance, max(counts)
+
+
+def max_probe_length(keys: list, function) -> int:
+    """Return the longest lookup probe sequence in an open addressing table holding keys."""
+    m = HashMap(len(keys) * 2, function)
+    for key in keys:
+        m.put(key, None)
+    return max(probe_count(m, key) for key in keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark hash function quality.')
+    parser.add_argument('--count', type=int, default=10_000)
+    args = parser.parse_args()
+
+    # Ideal (uniform random) bucket variance at load factor 1 is about 1.0
+    capacity = args.count
+    print(f"{'key set':<11} {'function':<16} {'variance':>10} {'max chain':>10} {'max probe':>10} {'keys/s':>10}")
+    for name, keys in key_sets(args.count).items():
+        for function in FUNCTIONS:
+            variance, longest = occupancy(keys, function, capacity)
+            probes = max_probe_length(keys, function)
+            start = time.perf_counter()
+            for key in keys:
+                function(key)
+            rate = len(keys) / (time.perf_counter() - start)
+            print(f"{name:<11} {function.__name__:<16} {variance:>10.2f} {longest:>10} {probes:>10} {rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
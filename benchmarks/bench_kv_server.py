@@ -0,0 +1,104 @@
+# Description: Load generator for kv_server. Opens several connections, runs
+#              a number of concurrent requesters on each (the pipeline depth)
+#              issuing a mixed get/put workload for a fixed duration, and
+#              reports throughput and p50/p99 request latency. Starts a local
+#              server process unless --port names a running one.
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import socket
+import time
+
+import hash_map_sc
+from a6_include import hash_function_2
+from kv_client import KVClient
+from kv_server import serve
+
+
+def free_port() -> int:
+    """Return a TCP port on localhost that is currently free."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def run_server(port: int) -> None:
+    """Server process: serve an empty separate chaining HashMap on port."""
+    asyncio.run(serve(hash_map_sc.HashMap(64, hash_function_2), '127.0.0.1', port))
+
+
+async def connect(port: int, attempts: int = 50) -> KVClient:
+    """Connect to the server, retrying while it starts up."""
+    for _ in range(attempts - 1):
+        try:
+            return await KVClient.connect('127.0.0.1', port)
+        except ConnectionError:
+            await asyncio.sleep(0.1)
+    return await KVClient.connect('127.0.0.1', port)
+
+
+async def requester(client: KVClient, keys: list, write_ratio: float, deadline: float,
+                    latencies: list, seed: int) -> None:
+    """Issue requests one after another until deadline, recording each latency."""
+    rnd = random.Random(seed)
+    while time.perf_counter() < deadline:
+        key = rnd.choice(keys)
+        start = time.perf_counter()
+        if rnd.random() < write_ratio:
+            await client.put(key, start)
+        else:
+            await client.get(key)
+        latencies.append(time.perf_counter() - start)
+
+
+async def load(port: int, args) -> None:
+    """Preload the keys, then run the timed workload and print the results."""
+    keys = ['key' + str(i) for i in range(args.keys)]
+    clients = [await connect(port) for _ in range(args.connections)]
+    for start in range(0, len(keys), 10_000):
+        await clients[0].put_many([(key, 0) for key in keys[start:start + 10_000]])
+
+    latencies = []
+    began = time.perf_counter()
+    deadline = began + args.duration
+    await asyncio.gather(*[requester(client, keys, args.write_ratio, deadline, latencies, n * args.depth + d)
+                           for n, client in enumerate(clients) for d in range(args.depth)])
+    elapsed = time.perf_counter() - began
+    for client in clients:
+        await client.close()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    print(f"{args.connections} connections x depth {args.depth}: {len(latencies) / elapsed:>10.0f} ops/s, "
+          f"p50 {p50:.0f} us, p99 {p99:.0f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Generate load against kv_server.')
+    parser.add_argument('--port', type=int, help='port of a running server (default: start one)')
+    parser.add_argument('--keys', type=int, default=100_000)
+    parser.add_argument('--connections', type=int, default=4)
+    parser.add_argument('--depth', type=int, default=16, help='concurrent requests per connection')
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--write-ratio', type=float, default=0.1)
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        server = multiprocessing.Process(target=run_server, args=(port,), daemon=True)
+        server.start()
+    try:
+        asyncio.run(load(port, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+
+if __name__ == '__main__':
+    main()
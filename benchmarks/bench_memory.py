@@ -0,0 +1,42 @@
+# Description: Report bytes per entry, measured with tracemalloc, for the
+#              separate chaining and open addressing maps at several sizes.
+#              Keys are allocated before measuring and reused as values, so
+#              only the maps' own nodes, entries and arrays are counted.
+
+import argparse
+import tracemalloc
+
+import hash_map_oa
+import hash_map_sc
+
+# Python's own hash keeps table sizes comparable across runs of different key sets
+HASH_FUNCTION = hash
+
+
+def bytes_per_entry(module, keys: list) -> float:
+    """Return bytes allocated by a map holding keys, divided by the number of keys."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    m = module.HashMap(16, HASH_FUNCTION)
+    for key in keys:
+        m.put(key, key)
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used / len(keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark memory per entry.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'entries':>9} {'sc bytes/entry':>15} {'oa bytes/entry':>15}")
+    for count in args.sizes:
+        keys = ['key' + str(i) for i in range(count)]
+        sc = bytes_per_entry(hash_map_sc, keys)
+        oa = bytes_per_entry(hash_map_oa, keys)
+        print(f"{count:>9} {sc:>15.1f} {oa:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
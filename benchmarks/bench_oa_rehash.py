@@ -0,0 +1,55 @@
+# Description: Compare the open addressing map's in-place rehash against the
+#              previous resize path, which built a temporary HashMap and
+#              re-inserted every entry through put().
+
+import argparse
+import time
+
+from a6_include import hash_function_2
+from hash_map_oa import HashMap
+
+
+def resize_through_put(m: HashMap, new_capacity: int) -> None:
+    """Previous resize_table behavior: a temporary map filled with one put() per entry."""
+    new_hash_table = HashMap(new_capacity, m._hash_function)
+    for i in range(m._capacity):
+        entry = m._buckets[i]
+        if entry is not None and entry.is_tombstone is False:
+            new_hash_table._put(entry.key, entry.value, entry.hash)
+    m._buckets = new_hash_table._buckets
+    m._capacity = new_hash_table._capacity
+
+
+def build(count: int) -> HashMap:
+    """Return a map holding count keys, with a tenth of them removed to leave tombstones."""
+    m = HashMap(count * 4, hash_function_2)
+    for i in range(count):
+        m.put('str' + str(i), i)
+    for i in range(0, count, 10):
+        m.remove('str' + str(i))
+    return m
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark open addressing resize paths.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 5, 10 ** 6],
+                        help='entry counts to benchmark, e.g. 100000 1000000 10000000')
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} {'put path (s)':>13} {'rehash (s)':>11} {'speedup':>8}")
+    for count in args.sizes:
+        m = build(count)
+        new_capacity = m.get_capacity() * 2
+        start = time.perf_counter()
+        resize_through_put(m, new_capacity)
+        before = time.perf_counter() - start
+
+        m = build(count)
+        start = time.perf_counter()
+        m._rehash(new_capacity)
+        after = time.perf_counter() - start
+        print(f"{count:>10} {before:>13.3f} {after:>11.3f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Description: Report probe counts for successful and unsuccessful lookups in
+#              the open addressing map under each probing strategy.
+
+import argparse
+
+from a6_include import hash_function_1, hash_function_2
+from hash_map_oa import HashMap
+from probing import DoubleHashing, LinearProbing, QuadraticProbing
+
+
+def probe_count(m: HashMap, key: str) -> int:
+    """Return number of buckets inspected by a lookup of key."""
+    hash = m._hash_function(key)
+    probes = 0
+    for probe_index in m._probing.probe(hash, key, m.get_capacity()):
+        probes += 1
+        entry = m._buckets[probe_index]
+        if entry is None:
+            break
+        if entry.is_tombstone is False and entry.hash == hash and entry.key == key:
+            break
+    return probes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark probe counts per probing strategy.')
+    parser.add_argument('--count', type=int, default=50_000)
+    args = parser.parse_args()
+
+    strategies = (('linear', LinearProbing()), ('quadratic', QuadraticProbing()),
+                  ('double', DoubleHashing()), ('double mix', DoubleHashing(None)))
+    print(f"{'strategy':<10} {'function':<16} {'hit mean':>9} {'hit max':>8} {'miss mean':>10} {'miss max':>9}")
+    for function in (hash_function_1, hash_function_2):
+        for name, strategy in strategies:
+            m = HashMap(16, function, strategy)
+            for i in range(args.count):
+                m.put('str' + str(i), i)
+
+            hits = [probe_count(m, 'str' + str(i)) for i in range(args.count)]
+            misses = [probe_count(m, 'miss' + str(i)) for i in range(args.count)]
+            print(f"{name:<10} {function.__name__:<16} {sum(hits) / len(hits):>9.2f} {max(hits):>8} "
+                  f"{sum(misses) / len(misses):>10.2f} {max(misses):>9}")
+
+
+if __name__ == "__main__":
+    main()
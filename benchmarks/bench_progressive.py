@@ -0,0 +1,59 @@
+# Description: Measure put tail latency while a map grows from empty to N
+#              keys, with resizes rehashing the whole table at once versus
+#              progressively a few buckets per operation. With stop-the-world
+#              resizes the slowest puts grow with the map; progressive
+#              rehashing keeps them flat. The cyclic garbage collector is
+#              paused while timing, since its full collections over millions
+#              of entries would otherwise dominate the slowest puts.
+
+import argparse
+import gc
+import time
+
+import hash_map_oa
+import hash_map_sc
+
+HASH_FUNCTION = hash
+
+
+def put_latencies(m, keys: list) -> list:
+    """Return sorted per-put latencies in nanoseconds for inserting keys into m."""
+    clock = time.perf_counter_ns
+    latencies = []
+    gc.disable()
+    try:
+        for i, key in enumerate(keys):
+            start = clock()
+            m.put(key, i)
+            latencies.append(clock() - start)
+    finally:
+        gc.enable()
+    latencies.sort()
+    return latencies
+
+
+def percentile(latencies: list, fraction: float) -> float:
+    """Return the latency at the given fraction of sorted latencies, in microseconds."""
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] / 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark put tail latency with progressive rehashing.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 4, 10 ** 5, 10 ** 6])
+    parser.add_argument('--step', type=int, default=4, help='buckets migrated per operation')
+    args = parser.parse_args()
+
+    print(f"{'map':<12} {'rehash':<10} {'keys':>9} {'p50':>8} {'p99':>8} {'p99.9':>8} {'p99.99':>8} "
+          f"{'max':>10}  (us)")
+    for module in (hash_map_sc, hash_map_oa):
+        for size in args.sizes:
+            keys = ['key' + str(i) for i in range(size)]
+            for name, step in (('at once', None), (f'step {args.step}', args.step)):
+                latencies = put_latencies(module.HashMap(8, HASH_FUNCTION, rehash_step=step), keys)
+                print(f"{module.__name__:<12} {name:<10} {size:>9} {percentile(latencies, 0.5):>8.2f} "
+                      f"{percentile(latencies, 0.99):>8.2f} {percentile(latencies, 0.999):>8.2f} "
+                      f"{percentile(latencies, 0.9999):>8.0f} {latencies[-1] / 1e3:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# Description: Compare resize_table time when keys are re-hashed (the previous
+#              behavior) against rehashing with the hash codes cached in each
+#              HashEntry / SLNode.
+
+import argparse
+import time
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import hash_function_1, hash_function_2
+
+
+def build(module, count: int, key_length: int, function):
+    """Return a map filled with count keys of roughly key_length characters."""
+    m = module.HashMap(count * 4, function)
+    padding = 'x' * max(0, key_length - 8)
+    for i in range(count):
+        m.put(padding + 'str' + str(i), i)
+    return m
+
+
+def time_resize(module, count: int, key_length: int, function, cached: bool) -> float:
+    """Return seconds spent resizing a populated map to twice its capacity."""
+    m = build(module, count, key_length, function)
+    new_capacity = m.get_capacity() * 2
+    if cached:
+        start = time.perf_counter()
+        m.resize_table(new_capacity)
+        return time.perf_counter() - start
+
+    keys = m.get_keys()
+    start = time.perf_counter()
+    new_map = module.HashMap(new_capacity, m._hash_function)
+    for i in range(keys.length()):
+        new_map.put(keys[i], i)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark resize_table with cached hash codes.')
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--key-length', type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"{'map':<4} {'function':<16} {'re-hash (s)':>12} {'cached (s)':>12} {'speedup':>8}")
+    for module in (hash_map_sc, hash_map_oa):
+        for function in (hash_function_1, hash_function_2):
+            before = time_resize(module, args.count, args.key_length, function, cached=False)
+            after = time_resize(module, args.count, args.key_length, function, cached=True)
+            name = module.__name__.split('_')[-1]
+            print(f"{name:<4} {function.__name__:<16} {before:>12.3f} {after:>12.3f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Description: Compare the separate chaining map with a fixed capacity against
+#              load-factor-driven grow and shrink on a steady-state workload
+#              (fill, then read) and a bursty one (fill, then delete most).
+
+import argparse
+import time
+
+import hash_map_oa
+import hash_map_sc
+from resize_policy import ResizePolicy
+
+# Python's own hash keeps this benchmark about table sizing rather than hash clustering
+HASH_FUNCTION = hash
+
+
+def steady(m, count: int) -> float:
+    """Insert count keys, then read each back. Return seconds taken."""
+    start = time.perf_counter()
+    for i in range(count):
+        m.put('key' + str(i), i)
+    for i in range(count):
+        m.get('key' + str(i))
+    return time.perf_counter() - start
+
+
+def bursty(m, count: int, bursts: int) -> (float, int):
+    """
+    Repeatedly insert count keys and remove 95% of them.
+    Return seconds taken and the largest capacity seen between bursts.
+    """
+    start = time.perf_counter()
+    peak = 0
+    for burst in range(bursts):
+        prefix = 'b' + str(burst) + '_'
+        for i in range(count):
+            m.put(prefix + str(i), i)
+        peak = max(peak, m.get_capacity())
+        for i in range(count - count // 20):
+            m.remove(prefix + str(i))
+    return time.perf_counter() - start, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark resize policies.')
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--bursts', type=int, default=5)
+    args = parser.parse_args()
+
+    maps = (
+        ('sc fixed capacity', lambda: hash_map_sc.HashMap(50, HASH_FUNCTION, ResizePolicy(float('inf')))),
+        ('sc grow + shrink', lambda: hash_map_sc.HashMap(50, HASH_FUNCTION)),
+        ('oa grow only', lambda: hash_map_oa.HashMap(50, HASH_FUNCTION)),
+        ('oa grow + shrink', lambda: hash_map_oa.HashMap(50, HASH_FUNCTION, policy=ResizePolicy(0.5, 0.125))),
+    )
+    print(f"{'map':<18} {'steady (s)':>11} {'bursty (s)':>11} {'peak cap':>9} {'final cap':>10} {'final size':>11}")
+    for name, factory in maps:
+        steady_time = steady(factory(), args.count)
+        m = factory()
+        bursty_time, peak = bursty(m, args.count, args.bursts)
+        print(f"{name:<18} {steady_time:>11.3f} {bursty_time:>11.3f} {peak:>9} {m.get_capacity():>10} {m.get_size():>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Description: Run a delete-heavy churn workload against the quadratic probing
+#              map and the Robin Hood map, then report lookup throughput and
+#              the Robin Hood probe distance spread at high load factors.
+
+import argparse
+import random
+import time
+
+import hash_map_oa
+import hash_map_rh
+
+# The course hash functions put sequential keys into a narrow range of buckets, which would
+# measure clustering from the hash function rather than from the collision strategy.
+HASH_FUNCTION = hash
+
+
+def churn(m, live: int, operations: int, seed: int = 0) -> list:
+    """
+    Fill m with live keys, then repeatedly remove a random key and insert a fresh one.
+    Return the keys left in the map.
+    """
+    rnd = random.Random(seed)
+    keys = ['key' + str(i) for i in range(live)]
+    for key in keys:
+        m.put(key, 0)
+    for i in range(operations):
+        slot = rnd.randrange(live)
+        m.remove(keys[slot])
+        keys[slot] = 'new' + str(i)
+        m.put(keys[slot], i)
+    return keys
+
+
+def lookups_per_second(m, keys) -> float:
+    """Return successful plus unsuccessful lookups per second."""
+    start = time.perf_counter()
+    for key in keys:
+        m.get(key)
+        m.get(key + '!')
+    return 2 * len(keys) / (time.perf_counter() - start)
+
+
+def distance_stats(m: hash_map_rh.HashMap) -> (float, float, int):
+    """Return mean, variance and maximum probe distance over the occupied buckets."""
+    distances = [m._distances[i] for i in range(m.get_capacity()) if m._distances[i] >= 0]
+    mean = sum(distances) / len(distances)
+    variance = sum((d - mean) ** 2 for d in distances) / len(distances)
+    return mean, variance, max(distances)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark Robin Hood hashing under churn.')
+    parser.add_argument('--live', type=int, default=20_000)
+    parser.add_argument('--operations', type=int, default=100_000)
+    args = parser.parse_args()
+
+    m = hash_map_oa.HashMap(args.live, HASH_FUNCTION)
+    keys = churn(m, args.live, args.operations)
+    print(f"quadratic   load {m.table_load():.2f}  {lookups_per_second(m, keys):>10.0f} lookups/s")
+
+    for max_load in (0.85, 0.9, 0.95):
+        # Size the table so the live keys sit just under the target load factor
+        m = hash_map_rh.HashMap(int(args.live / max_load) + 1, HASH_FUNCTION, max_load)
+        keys = churn(m, args.live, args.operations)
+        mean, variance, longest = distance_stats(m)
+        print(f"robin hood  load {m.table_load():.2f}  {lookups_per_second(m, keys):>10.0f} lookups/s"
+              f"  distance mean {mean:.2f} var {variance:.2f} max {longest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Description: Measure aggregate lookups per second against a sharded
+#              shared-memory map as the number of reader processes grows.
+#              Every reader attaches to the same published shards, so no
+#              process holds a private copy of the table.
+
+import argparse
+import multiprocessing
+import os
+import random
+import time
+
+from hash_functions import mix_hash
+from sharded_map import ShardedHashMap, ShardedReader
+
+
+def reader(name: str, keys: list, lookups: int, seed: int, start, results) -> None:
+    """Reader process: attach, wait at the start barrier, then time lookups random gets."""
+    rnd = random.Random(seed)
+    picks = [rnd.choice(keys) for _ in range(lookups)]
+    with ShardedReader(name, mix_hash) as m:
+        m.get_size()        # attach to every shard before timing
+        start.wait()
+        began = time.perf_counter()
+        for key in picks:
+            m.get(key)
+        results.put((began, time.perf_counter()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark shared-memory sharded map lookups.')
+    parser.add_argument('--keys', type=int, default=200_000)
+    parser.add_argument('--shards', type=int, default=8)
+    parser.add_argument('--lookups', type=int, default=200_000, help='lookups per reader')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    keys = ['key' + str(i) for i in range(args.keys)]
+    with ShardedHashMap(args.shards, mix_hash) as m:
+        for i, key in enumerate(keys):
+            m.put(key, i)
+        m.publish()
+
+        for workers in args.workers:
+            start = multiprocessing.Barrier(workers + 1)
+            results = multiprocessing.Queue()
+            processes = [multiprocessing.Process(target=reader,
+                                                 args=(m.name, keys, args.lookups, n, start, results))
+                         for n in range(workers)]
+            for process in processes:
+                process.start()
+            start.wait()
+            spans = [results.get() for _ in processes]
+            for process in processes:
+                process.join()
+
+            elapsed = max(end for _, end in spans) - min(began for began, _ in spans)
+            print(f"{workers:>3} readers {workers * args.lookups / elapsed:>12.0f} lookups/s")
+
+
+if __name__ == '__main__':
+    main()
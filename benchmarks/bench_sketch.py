@@ -0,0 +1,60 @@
+# Description: Compare approximate heavy hitters (Count-Min sketch plus a small
+#              candidate HashMap) with exact find_mode on Zipf-skewed and
+#              uniform data: speed, mode agreement, top-10 recall and the
+#              error of the estimated counts.
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from a6_include import DynamicArray
+from hash_map_sc import find_mode
+from sketch import HeavyHitters
+
+
+def datasets(count: int, distinct: int, seed: int = 0) -> dict:
+    """Return named lists of count values."""
+    rnd = random.Random(seed)
+    return {
+        'zipf': ['v' + str(min(int(rnd.paretovariate(1.0)), distinct)) for _ in range(count)],
+        'uniform': ['v' + str(rnd.randrange(distinct)) for _ in range(count)],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark approximate find_mode.')
+    parser.add_argument('--count', type=int, default=500_000)
+    parser.add_argument('--distinct', type=int, default=200_000)
+    parser.add_argument('--k', type=int, default=100)
+    parser.add_argument('--epsilon', type=float, nargs='+', default=[0.001, 0.0001])
+    args = parser.parse_args()
+
+    print(f"{'data':<8} {'method':<18} {'seconds':>8} {'mode ok':>8} {'top10 recall':>13} "
+          f"{'max rel err':>12} {'sketch bytes':>13}")
+    for name, values in datasets(args.count, args.distinct).items():
+        exact = Counter(values)
+        true_top = [value for value, _ in exact.most_common(10)]
+
+        da = DynamicArray(values)
+        start = time.perf_counter()
+        mode_array, frequency = find_mode(da)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} {'find_mode':<18} {elapsed:>8.2f} {'yes':>8} {1.0:>13.2f} {0.0:>12.3f} {'-':>13}")
+
+        for epsilon in args.epsilon:
+            start = time.perf_counter()
+            hitters = HeavyHitters(args.k, epsilon=epsilon).consume(values)
+            elapsed = time.perf_counter() - start
+
+            approx_modes, approx_frequency = hitters.mode()
+            mode_ok = approx_modes.length() > 0 and exact[approx_modes[0]] == frequency
+            top = hitters.top_k(10)
+            recall = len({value for value, _ in top} & set(true_top)) / len(true_top)
+            error = max((estimate - exact[value]) / exact[value] for value, estimate in top)
+            print(f"{name:<8} {'sketch e=' + str(epsilon):<18} {elapsed:>8.2f} {'yes' if mode_ok else 'no':>8} "
+                  f"{recall:>13.2f} {error:>12.3f} {hitters.memory_bytes():>13}")
+
+
+if __name__ == "__main__":
+    main()
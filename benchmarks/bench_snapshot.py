@@ -0,0 +1,60 @@
+# Description: Compare startup paths for a populated map: rebuilding an open
+#              addressing HashMap with put calls versus opening a saved
+#              snapshot with mmap. Reports time to open and latency of the
+#              first lookup for each, plus steady-state get latency.
+
+import argparse
+import os
+import tempfile
+import time
+
+import hash_map_oa
+import snapshot
+from hash_functions import mix_hash
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark snapshot open against a rebuild.')
+    parser.add_argument('--keys', type=int, default=1_000_000)
+    parser.add_argument('--lookups', type=int, default=100_000)
+    args = parser.parse_args()
+
+    keys = ['key' + str(i) for i in range(args.keys)]
+
+    start = time.perf_counter()
+    m = hash_map_oa.HashMap(64, mix_hash)
+    for i, key in enumerate(keys):
+        m.put(key, i)
+    rebuild = time.perf_counter() - start
+    start = time.perf_counter()
+    m.get(keys[-1])
+    rebuild_first = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'map.snapshot')
+        size = snapshot.save(m, path)
+
+        start = time.perf_counter()
+        table = snapshot.load(path, mix_hash)
+        opened = time.perf_counter() - start
+        start = time.perf_counter()
+        table.get(keys[-1])
+        opened_first = time.perf_counter() - start
+
+        lookups = keys[::max(1, len(keys) // args.lookups)]
+        timings = []
+        for source in (m, table):
+            start = time.perf_counter()
+            for key in lookups:
+                source.get(key)
+            timings.append((time.perf_counter() - start) / len(lookups))
+        table.close()
+
+    print(f"{args.keys} keys, snapshot {size / 2 ** 20:.1f} MiB")
+    print(f"{'':<10} {'open':>12} {'first get':>12} {'get':>12}")
+    print(f"{'rebuild':<10} {rebuild * 1e3:>9.1f} ms {rebuild_first * 1e6:>9.1f} us {timings[0] * 1e6:>9.2f} us")
+    print(f"{'snapshot':<10} {opened * 1e3:>9.3f} ms {opened_first * 1e6:>9.1f} us {timings[1] * 1e6:>9.2f} us")
+
+
+if __name__ == '__main__':
+    main()
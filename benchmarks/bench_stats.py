@@ -0,0 +1,57 @@
+# Description: Fill both maps with stats enabled, print the probe, chain and
+#              resize statistics for each hash function, and measure the
+#              cost of keeping the counters on put and get.
+
+import argparse
+import time
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import hash_function_1, hash_function_2
+
+
+def fill_and_read(m, keys: list) -> float:
+    """Put keys into m, then get each of them and a missing key per key. Return seconds taken."""
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        m.put(key, i)
+    for key in keys:
+        m.get(key)
+        m.get(key + '?')
+    return time.perf_counter() - start
+
+
+def describe(stats: dict) -> str:
+    """Return a one-line summary of a get_stats snapshot."""
+    line = (f"get {stats['get_probes']['mean']:.2f}/{stats['get_probes']['max']} "
+            f"put {stats['put_probes']['mean']:.2f}/{stats['put_probes']['max']} "
+            f"load {stats['load']:.2f} resizes {stats['resizes']} "
+            f"({stats['resize_seconds'] * 1e3:.1f} ms)")
+    if 'chains' in stats:
+        line += f" chains {stats['chains']['mean']:.2f}/{stats['chains']['max']}"
+    return line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Show HashMap statistics and their overhead.')
+    parser.add_argument('--keys', type=int, default=20_000)
+    args = parser.parse_args()
+
+    keys = ['key' + str(i) for i in range(args.keys)]
+
+    print('probes are mean/max per operation, chains mean/max length')
+    for module in (hash_map_sc, hash_map_oa):
+        for function in (hash_function_1, hash_function_2):
+            m = module.HashMap(8, function, stats=True)
+            fill_and_read(m, keys)
+            print(f"{module.__name__:<12} {function.__name__:<16} {describe(m.get_stats())}")
+
+    print('overhead')
+    for module in (hash_map_sc, hash_map_oa):
+        plain = fill_and_read(module.HashMap(8, hash_function_2), keys)
+        counted = fill_and_read(module.HashMap(8, hash_function_2, stats=True), keys)
+        print(f"{module.__name__:<12} {plain:>8.3f} s {counted:>8.3f} s with stats {counted / plain:>6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
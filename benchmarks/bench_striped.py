@@ -0,0 +1,103 @@
+# Description: Measure multi-threaded throughput of a mixed get/put workload
+#              on a separate chaining HashMap behind one global lock versus
+#              the lock-striped HashMap, for increasing thread counts. Run it
+#              under a free-threaded CPython build (python3.13t and later) to
+#              see whether the stripes scale; with the GIL, threads only
+#              interleave, and the numbers show locking overhead, not scaling.
+#              So far it has only been run on a GIL build, on one CPU.
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+import hash_map_sc
+import hash_map_striped
+
+HASH_FUNCTION = hash
+
+
+class LockedHashMap:
+    """A hash_map_sc.HashMap with every operation serialized by one lock."""
+
+    def __init__(self, capacity: int, function) -> None:
+        """Initialize an empty map guarded by a new lock."""
+        self._map = hash_map_sc.HashMap(capacity, function)
+        self._lock = threading.Lock()
+
+    def put(self, key: str, value: object) -> None:
+        """Update key/value pair while holding the lock."""
+        with self._lock:
+            self._map.put(key, value)
+
+    def get(self, key: str) -> object:
+        """Return value of given key while holding the lock."""
+        with self._lock:
+            return self._map.get(key)
+
+
+def gil_status() -> str:
+    """Describe whether this interpreter is running with the GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    if is_gil_enabled is None:
+        return 'GIL enabled (interpreter has no free-threaded mode)'
+    return 'GIL enabled' if is_gil_enabled() else 'GIL disabled (free-threaded)'
+
+
+def run(m, keys: list, threads: int, operations: int, write_ratio: float) -> float:
+    """Run operations mixed get/put calls split across threads; return operations per second."""
+    per_thread = operations // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        """Draw this thread's operations, wait for the others, then run them."""
+        rnd = random.Random(seed)
+        picks = [(rnd.choice(keys), rnd.random() < write_ratio) for _ in range(per_thread)]
+        barrier.wait()
+        for key, write in picks:
+            if write:
+                m.put(key, 0)
+            else:
+                m.get(key)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark a lock-striped HashMap across threads.')
+    parser.add_argument('--keys', type=int, default=100_000)
+    parser.add_argument('--operations', type=int, default=800_000)
+    parser.add_argument('--write-ratio', type=float, default=0.1)
+    parser.add_argument('--stripes', type=int, default=16)
+    parser.add_argument('--threads', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    keys = ['key' + str(i) for i in range(args.keys)]
+    status = gil_status()
+    print(f"{sys.version.split()[0]}, {status}, {os.cpu_count()} CPUs")
+    if not status.startswith('GIL disabled'):
+        print('threads share the GIL: these numbers show locking overhead, not scaling')
+    print(f"{'threads':>7} {'global lock':>14} {'striped':>14}")
+
+    for threads in args.threads:
+        results = []
+        for m in (LockedHashMap(args.keys, HASH_FUNCTION),
+                  hash_map_striped.HashMap(args.keys, HASH_FUNCTION, args.stripes)):
+            for key in keys:
+                m.put(key, 0)
+            results.append(run(m, keys, threads, args.operations, args.write_ratio))
+        print(f"{threads:>7} {results[0]:>10.0f} op/s {results[1]:>10.0f} op/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# Description: Run a long put/remove churn workload against the open addressing
+#              map with and without tombstone compaction, and report miss
+#              lookup latency as the workload progresses.
+
+import argparse
+import random
+import time
+
+from hash_map_oa import HashMap
+
+# Python's own hash keeps this benchmark about tombstones rather than hash clustering
+HASH_FUNCTION = hash
+
+
+def miss_latency(m: HashMap, probes: int) -> float:
+    """Return mean microseconds per unsuccessful get."""
+    start = time.perf_counter()
+    for i in range(probes):
+        m.get('miss' + str(i))
+    return (time.perf_counter() - start) / probes * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark lookups under put/remove churn.')
+    parser.add_argument('--live', type=int, default=10_000)
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--operations', type=int, default=20_000, help='churn operations per round')
+    args = parser.parse_args()
+
+    for label, threshold in (('no compaction', None), ('compact at 0.75', 0.75)):
+        print(label)
+        print(f"{'round':>6} {'miss us/op':>11} {'tombstones':>11} {'empty':>8} {'capacity':>9}")
+        rnd = random.Random(0)
+        m = HashMap(args.live * 2 + 1, HASH_FUNCTION, compact_threshold=threshold)
+        keys = ['key' + str(i) for i in range(args.live)]
+        for key in keys:
+            m.put(key, 0)
+
+        counter = 0
+        for round in range(args.rounds):
+            for _ in range(args.operations):
+                slot = rnd.randrange(args.live)
+                m.remove(keys[slot])
+                counter += 1
+                keys[slot] = 'churn' + str(counter)
+                m.put(keys[slot], counter)
+            latency = miss_latency(m, 2_000)
+            print(f"{round:>6} {latency:>11.2f} {m.get_tombstones():>11} {m.empty_buckets():>8} {m.get_capacity():>9}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Description: Measure durable HashMap write throughput under different
+#              fsync policies (every write, group commit at several intervals,
+#              and leaving it to the OS), and recovery time from logs of
+#              increasing size.
+
+import argparse
+import os
+import tempfile
+import time
+
+import hash_map_sc
+from durable import LOG_MAGIC, PUT, DurableHashMap, _record
+from flat_table import encode_value
+
+HASH_FUNCTION = hash
+
+
+def write_throughput(path: str, writes: int, fsync_interval: float) -> float:
+    """Return puts per second into a fresh durable map with the given fsync interval."""
+    if os.path.exists(path):
+        os.remove(path)
+    with DurableHashMap.open(path, hash_map_sc.HashMap, HASH_FUNCTION, fsync_interval,
+                             compact_ratio=None) as m:
+        start = time.perf_counter()
+        for i in range(writes):
+            m.put('key' + str(i), i)
+        m.sync()
+        return writes / (time.perf_counter() - start)
+
+
+def write_log(path: str, entries: int) -> None:
+    """Write a log of entries put records directly, without building a map."""
+    with open(path, 'wb') as file:
+        file.write(LOG_MAGIC)
+        for i in range(entries):
+            file.write(_record(PUT, 'key' + str(i), encode_value(i)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark write-ahead log throughput and recovery.')
+    parser.add_argument('--writes', type=int, default=200_000)
+    parser.add_argument('--synced-writes', type=int, default=2_000,
+                        help='writes for the fsync-every-write policy')
+    parser.add_argument('--intervals', type=float, nargs='+', default=[0.001, 0.01, 0.1])
+    parser.add_argument('--recover', type=int, nargs='+', default=[10 ** 6, 10 ** 7])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'map.wal')
+
+        print('write throughput')
+        policies = [('every write', 0, args.synced_writes)]
+        policies += [(f'every {interval * 1e3:g} ms', interval, args.writes) for interval in args.intervals]
+        policies += [('OS only', None, args.writes)]
+        for name, interval, writes in policies:
+            print(f"  {name:<14} {write_throughput(path, writes, interval):>10.0f} puts/s")
+
+        print('recovery')
+        for entries in args.recover:
+            write_log(path, entries)
+            start = time.perf_counter()
+            m = DurableHashMap.open(path, hash_map_sc.HashMap, HASH_FUNCTION, None)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path)
+            m.close()
+            print(f"  {entries:>10} entries {size / 2 ** 20:>8.1f} MiB {elapsed:>8.2f} s")
+
+
+if __name__ == '__main__':
+    main()
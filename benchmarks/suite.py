@@ -0,0 +1,293 @@
+# Description: Reproducible benchmark suite comparing the separate chaining
+#              map, the open addressing map and the built-in dict. Every
+#              workload runs on every key set, for both hash functions and
+#              several initial capacities, and reports ops/s, bytes per entry
+#              and per-operation latency percentiles. Keys and operation
+#              streams come from a seeded generator, and results can be saved
+#              as JSON and compared against an earlier run:
+#                  python -m benchmarks.suite --output before.json
+#                  python -m benchmarks.suite --compare before.json
+
+import argparse
+import gc
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import hash_function_1, hash_function_2
+
+PUT, GET, REMOVE = 0, 1, 2
+
+# Share of gets in the Zipf workload, the rest are puts, and the skew of its key popularity
+ZIPF_GET_RATIO = 0.9
+ZIPF_EXPONENT = 1.1
+
+FUNCTIONS = {'hash_function_1': hash_function_1, 'hash_function_2': hash_function_2}
+
+
+class DictMap:
+    """
+    The built-in dict behind the put/get/remove interface of the HashMap classes, as a baseline.
+    The hash function and capacity are ignored.
+    """
+
+    def __init__(self, capacity: int, function) -> None:
+        """Initialize an empty dict."""
+        self._data = {}
+
+    def put(self, key: str, value: object) -> None:
+        """Update key/value pair."""
+        self._data[key] = value
+
+    def get(self, key: str) -> object:
+        """Return value of given key, or None."""
+        return self._data.get(key)
+
+    def remove(self, key: str) -> None:
+        """Remove given key if it exists."""
+        self._data.pop(key, None)
+
+
+MAPS = {'sc': hash_map_sc.HashMap, 'oa': hash_map_oa.HashMap, 'dict': DictMap}
+
+
+# ------------------------------------------------------------------ #
+# Key sets: each returns count distinct keys
+
+def sequential_keys(count: int) -> list:
+    """Return keys 'str0', 'str1', ... as typical application code generates them."""
+    return ['str' + str(i) for i in range(count)]
+
+
+def anagram_keys(count: int) -> list:
+    """
+    Return permutations of the same letters. hash_function_1 sums character codes, so it maps
+    all of them to one hash code.
+    """
+    letters = 'abcdefghij'
+    return [''.join(p) for p in itertools.islice(itertools.permutations(letters), count)]
+
+
+KEY_SETS = {'sequential': sequential_keys, 'anagram': anagram_keys}
+
+
+# ------------------------------------------------------------------ #
+# Workloads: each returns the keys to put before timing and the timed (operation, key) stream
+
+def insert_workload(keys: list, spare: list, rnd: random.Random) -> (list, list):
+    """Put every key into an empty map."""
+    return [], [(PUT, key) for key in keys]
+
+
+def read_workload(keys: list, spare: list, rnd: random.Random) -> (list, list):
+    """Get random present keys."""
+    return keys, [(GET, rnd.choice(keys)) for _ in keys]
+
+
+def miss_workload(keys: list, spare: list, rnd: random.Random) -> (list, list):
+    """Get keys that are not in the map."""
+    return keys, [(GET, key) for key in spare]
+
+
+def churn_workload(keys: list, spare: list, rnd: random.Random) -> (list, list):
+    """Remove a random present key and put a new one, keeping the size steady."""
+    live = list(keys)
+    ops = []
+    for key in spare:
+        index = rnd.randrange(len(live))
+        ops.append((REMOVE, live[index]))
+        ops.append((PUT, key))
+        live[index] = key
+    return keys, ops
+
+
+def zipf_workload(keys: list, spare: list, rnd: random.Random) -> (list, list):
+    """Get and put keys with Zipf-distributed popularity, so a few hot keys dominate."""
+    weights = list(itertools.accumulate(1 / (rank + 1) ** ZIPF_EXPONENT for rank in range(len(keys))))
+    hot = rnd.choices(keys, cum_weights=weights, k=len(keys))
+    return keys, [(GET if rnd.random() < ZIPF_GET_RATIO else PUT, key) for key in hot]
+
+
+WORKLOADS = {'insert': insert_workload, 'read': read_workload, 'miss': miss_workload,
+             'churn': churn_workload, 'zipf': zipf_workload}
+
+
+# ------------------------------------------------------------------ #
+
+def run(m, ops: list, latencies: list = None) -> float:
+    """
+    Apply ops to m and return seconds taken. If latencies is a list, each operation is timed on
+    its own and its nanoseconds appended.
+    """
+    put, get, remove = m.put, m.get, m.remove
+    clock = time.perf_counter_ns
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        if latencies is None:
+            for kind, key in ops:
+                if kind == GET:
+                    get(key)
+                elif kind == PUT:
+                    put(key, key)
+                else:
+                    remove(key)
+        else:
+            for kind, key in ops:
+                begin = clock()
+                if kind == GET:
+                    get(key)
+                elif kind == PUT:
+                    put(key, key)
+                else:
+                    remove(key)
+                latencies.append(clock() - begin)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def filled(map_class, function, capacity: int, keys: list):
+    """Return a new map of map_class holding keys."""
+    m = map_class(capacity, function)
+    for key in keys:
+        m.put(key, key)
+    return m
+
+
+def bytes_per_entry(map_class, function, capacity: int, keys: list) -> float:
+    """Return bytes allocated by a map holding keys, divided by the number of keys."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    m = filled(map_class, function, capacity, keys)
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used / len(keys)
+
+
+def percentile(latencies: list, fraction: float) -> int:
+    """Return the latency at the given fraction of sorted latencies."""
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))]
+
+
+def measure(map_class, function, capacity: int, prefill: list, ops: list) -> dict:
+    """
+    Run ops twice on freshly filled maps: once untimed per operation for throughput, once timing
+    every operation for latency percentiles.
+    """
+    seconds = run(filled(map_class, function, capacity, prefill), ops)
+    latencies = []
+    run(filled(map_class, function, capacity, prefill), ops, latencies)
+    latencies.sort()
+    return {'ops': len(ops),
+            'ops_per_sec': len(ops) / seconds,
+            'p50_ns': percentile(latencies, 0.5),
+            'p99_ns': percentile(latencies, 0.99),
+            'p999_ns': percentile(latencies, 0.999),
+            'max_ns': latencies[-1]}
+
+
+def cases(args):
+    """Yield (map, function, capacity) for every configuration selected by args."""
+    for map_name in args.maps:
+        if map_name == 'dict':
+            yield map_name, None, None
+            continue
+        for function_name in args.functions:
+            for capacity in args.capacities:
+                yield map_name, function_name, capacity
+
+
+def run_suite(args) -> list:
+    """Run every selected benchmark and return one result dict per run."""
+    results = []
+    for key_set in args.key_sets:
+        count = args.adversarial_keys if key_set == 'anagram' else args.keys
+        all_keys = KEY_SETS[key_set](2 * count)
+        keys, spare = all_keys[:count], all_keys[count:]
+
+        for map_name, function_name, capacity in cases(args):
+            map_class, function = MAPS[map_name], FUNCTIONS.get(function_name)
+            memory = bytes_per_entry(map_class, function, capacity or 16, keys)
+            for workload in args.workloads:
+                # Every run sees the same operation stream, whatever ran before it
+                rnd = random.Random(f'{args.seed}/{key_set}/{workload}')
+                prefill, ops = WORKLOADS[workload](keys, spare, rnd)
+                result = {'map': map_name, 'function': function_name, 'capacity': capacity,
+                          'keys': key_set, 'entries': count, 'workload': workload,
+                          'bytes_per_entry': memory}
+                result.update(measure(map_class, function, capacity or 16, prefill, ops))
+                results.append(result)
+                print(format_result(result), flush=True)
+    return results
+
+
+def result_key(result: dict) -> tuple:
+    """Return the configuration a result belongs to, for matching results of different runs."""
+    return result['map'], result['function'], result['capacity'], result['keys'], result['workload']
+
+
+def format_result(result: dict, baseline: dict = None) -> str:
+    """Return one table row for result, with its speedup over baseline if given."""
+    function = (result['function'] or '-').replace('hash_function_', 'hf')
+    line = (f"{result['map']:<5} {function:<4} {result['capacity'] or '-':>6} {result['keys']:<11} "
+            f"{result['workload']:<7} {result['ops_per_sec']:>11.0f} {result['bytes_per_entry']:>8.1f} "
+            f"{result['p50_ns']:>8} {result['p99_ns']:>8} {result['p999_ns']:>9}")
+    if baseline is not None:
+        line += f" {result['ops_per_sec'] / baseline['ops_per_sec']:>7.2f}x"
+    return line
+
+
+HEADER = (f"{'map':<5} {'hash':<4} {'cap':>6} {'keys':<11} {'work':<7} {'ops/s':>11} {'B/entry':>8} "
+          f"{'p50 ns':>8} {'p99 ns':>8} {'p99.9 ns':>9}")
+
+
+def compare(results: list, path: str) -> None:
+    """Print results next to the throughput ratio against the matching results saved at path."""
+    with open(path) as file:
+        baseline = {result_key(result): result for result in json.load(file)['results']}
+    print(f'compared with {path}')
+    print(HEADER + '  speedup')
+    for result in results:
+        old = baseline.get(result_key(result))
+        if old is not None:
+            print(format_result(result, old))
+
+
+def main() -> None:
+    """Parse the command line, run the suite, then save and compare results as requested."""
+    parser = argparse.ArgumentParser(description='Benchmark suite for the HashMap implementations.')
+    parser.add_argument('--keys', type=int, default=10_000, help='entries per map')
+    parser.add_argument('--adversarial-keys', type=int, default=1_000,
+                        help='entries per map with anagram keys, which collide under hash_function_1')
+    parser.add_argument('--capacities', type=int, nargs='+', default=[16, 1024, 16384])
+    parser.add_argument('--maps', nargs='+', choices=list(MAPS), default=list(MAPS))
+    parser.add_argument('--functions', nargs='+', choices=list(FUNCTIONS), default=list(FUNCTIONS))
+    parser.add_argument('--workloads', nargs='+', choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument('--key-sets', nargs='+', choices=list(KEY_SETS), default=list(KEY_SETS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='save results as JSON to this path')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against')
+    args = parser.parse_args()
+
+    print(HEADER)
+    results = run_suite(args)
+
+    if args.output is not None:
+        report = {'python': sys.version, 'platform': platform.platform(),
+                  'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'options': vars(args),
+                  'results': results}
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=1)
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+# Description: A bounded cache built on the HashMap classes. The map stores
+#              one CacheEntry per key, and the entries themselves are linked
+#              into a doubly linked list in recency order, so a hit moves its
+#              entry to the front and an eviction unlinks the back, both in
+#              O(1). Entries can expire after a time to live: expired entries
+#              are dropped when accessed, and a sweep cursor checks a few
+#              entries per write so untouched ones are reclaimed too.
+
+import sys
+import time
+
+import hash_map_sc
+from a6_include import hash_function_2
+
+# Entries checked for expiry by the sweep on every put
+SWEEP_STEP = 2
+
+
+def default_sizeof(key: str, value: object) -> int:
+    """Return the shallow size of a key and value in bytes."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class CacheEntry:
+    """
+    Value stored in the cache's map for each key, doubling as a node of the
+    recency list.
+    """
+
+    __slots__ = ('key', 'value', 'size', 'expires', 'prev', 'next')
+
+    def __init__(self, key: str, value: object, size: int = 0, expires: float = None) -> None:
+        """Initialize an unlinked entry; expires is a clock time, or None to never expire."""
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.prev = None
+        self.next = None
+
+
+class LRUCache:
+    """
+    Least recently used cache with optional max_entries and max_bytes limits
+    and per-key time to live.
+    """
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None, ttl: float = None,
+                 function=hash_function_2, map_class=hash_map_sc.HashMap, sizeof=default_sizeof,
+                 clock=time.monotonic) -> None:
+        """
+        Initialize an empty cache. ttl is the default time to live in seconds (None never expires).
+        sizeof(key, value) gives an entry's size for max_bytes, and clock the current time for ttl.
+        """
+        self._map = map_class(64, function)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+
+        # Circular list through a sentinel: head.next is the most recently used entry
+        self._head = CacheEntry(None, None)
+        self._head.prev = self._head.next = self._head
+        self._cursor = self._head
+        self._bytes = 0
+        self._expiring = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # ------------------------------------------------------------------ #
+
+    def _link(self, entry: CacheEntry) -> None:
+        """Insert entry at the front of the recency list."""
+        entry.prev = self._head
+        entry.next = self._head.next
+        self._head.next.prev = entry
+        self._head.next = entry
+
+    def _unlink(self, entry: CacheEntry) -> None:
+        """Remove entry from the recency list, stepping the sweep cursor past it."""
+        if entry is self._cursor:
+            self._cursor = entry.prev
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+
+    def _drop(self, entry: CacheEntry) -> None:
+        """Remove entry from the map and the recency list."""
+        self._map.remove(entry.key)
+        self._unlink(entry)
+        self._bytes -= entry.size
+        self._expiring -= entry.expires is not None
+
+    def _expired(self, entry: CacheEntry) -> bool:
+        """Return True if entry has outlived its time to live."""
+        return entry.expires is not None and entry.expires <= self._clock()
+
+    def _lookup(self, key: str) -> CacheEntry:
+        """
+        Return the live entry of key, or None. An expired entry is dropped and counts as absent.
+        """
+        entry = self._map.get(key)
+        if entry is not None and self._expired(entry):
+            self._drop(entry)
+            self.expirations += 1
+            return None
+        return entry
+
+    def get(self, key: str, default: object = None) -> object:
+        """
+        Return value associated with given key and mark it most recently used, or return default.
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        if entry.prev is not self._head:
+            self._unlink(entry)
+            self._link(entry)
+        return entry.value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        If key exists and hasn't expired, return True. Else, return False. Recency is unchanged.
+        """
+        return self._lookup(key) is not None
+
+    def put(self, key: str, value: object, ttl: float = None) -> None:
+        """
+        Add or replace key's value as the most recently used entry, expiring after ttl seconds
+        (default: the cache's ttl). Least recently used entries are evicted while the cache is over
+        its limits.
+        """
+        ttl = self._ttl if ttl is None else ttl
+        expires = None if ttl is None else self._clock() + ttl
+        size = self._sizeof(key, value) if self._max_bytes is not None else 0
+
+        entry = self._map.get(key)
+        if entry is None:
+            entry = CacheEntry(key, value, size, expires)
+            self._map.put(key, entry)
+        else:
+            self._unlink(entry)
+            self._bytes -= entry.size
+            self._expiring -= entry.expires is not None
+            entry.value, entry.size, entry.expires = value, size, expires
+        self._link(entry)
+        self._bytes += size
+        self._expiring += expires is not None
+
+        self._evict()
+        self.sweep(SWEEP_STEP)
+
+    def remove(self, key: str) -> None:
+        """
+        Remove given key and associated value from the cache.
+        """
+        entry = self._map.get(key)
+        if entry is not None:
+            self._drop(entry)
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until the cache is within its limits."""
+        while self._head.prev is not self._head and (
+                (self._max_entries is not None and self._map.get_size() > self._max_entries) or
+                (self._max_bytes is not None and self._bytes > self._max_bytes)):
+            self._drop(self._head.prev)
+            self.evictions += 1
+
+    def sweep(self, count: int = None) -> int:
+        """
+        Check up to count entries (default: all) for expiry, continuing from where the last sweep
+        stopped and walking from least to most recently used. Return number of entries dropped.
+        """
+        if self._expiring == 0:
+            return 0
+
+        count = self._map.get_size() if count is None else count
+        dropped = 0
+        now = self._clock()
+        for _ in range(count):
+            if self._cursor is self._head:
+                self._cursor = self._head.prev
+                if self._cursor is self._head:
+                    break
+            entry = self._cursor
+            self._cursor = entry.prev
+            if entry.expires is not None and entry.expires <= now:
+                self._drop(entry)
+                self.expirations += 1
+                dropped += 1
+        return dropped
+
+    def get_size(self) -> int:
+        """
+        Return number of entries in the cache, including expired ones not yet dropped
+        """
+        return self._map.get_size()
+
+    def get_bytes(self) -> int:
+        """Return total size of the entries, as measured for max_bytes."""
+        return self._bytes
+
+    def clear(self) -> None:
+        """
+        Clear cache of all contents. Counters are kept.
+        """
+        self._map.clear()
+        self._head.prev = self._head.next = self._head
+        self._cursor = self._head
+        self._bytes = 0
+        self._expiring = 0
+
+    def stats(self) -> dict:
+        """Return the hit, miss, eviction and expiration counters with the current size."""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'expirations': self.expirations, 'entries': self._map.get_size(),
+                'bytes': self._bytes}
+
+    def __len__(self) -> int:
+        """Return number of entries, so len(cache) works."""
+        return self._map.get_size()
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if key is cached and live, so `key in cache` works."""
+        return self.contains_key(key)
@@ -0,0 +1,314 @@
+# Description: Make a HashMap durable with an append-only write-ahead log.
+#              Every put and remove is appended to the log as a checksummed
+#              record. A background thread flushes and fsyncs the log every
+#              fsync_interval seconds, so one fsync commits a whole group of
+#              writes. On open, the log is replayed into a map presized for it,
+#              and once the log holds too many dead records the same thread
+#              compacts it into one put record per live key, while writes
+#              continue to the old log.
+
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+from flat_table import TEXT_ERRORS, decode_value, encode_value
+
+LOG_MAGIC = b'HMWAL001'
+# crc32 of the rest of the record, operation, key length, value length
+RECORD = struct.Struct('<IBII')
+
+PUT = 1
+REMOVE = 2
+
+_MISSING = object()
+
+
+def _records(buffer, start: int, end: int):
+    """
+    Yield (operation, key offset, key length, value length, next offset) for each record in
+    buffer[start:end], stopping at the first truncated record or checksum mismatch.
+    """
+    offset = start
+    while offset + RECORD.size <= end:
+        crc, operation, key_length, value_length = RECORD.unpack_from(buffer, offset)
+        data_start = offset + RECORD.size
+        data_end = data_start + key_length + value_length
+        if data_end > end or operation not in (PUT, REMOVE):
+            return
+        if zlib.crc32(buffer[data_start:data_end], zlib.crc32(buffer[offset + 4:data_start])) != crc:
+            return
+        yield operation, data_start, key_length, value_length, data_end
+        offset = data_end
+
+
+def _record(operation: int, key: str, value: bytes = b'') -> bytes:
+    """Return the bytes of one log record."""
+    return _encoded_record(operation, key.encode('utf-8', TEXT_ERRORS), value)
+
+
+def _encoded_record(operation: int, key: bytes, value: bytes) -> bytes:
+    """Return the bytes of one log record for an already encoded key."""
+    header = struct.pack('<BII', operation, len(key), len(value))
+    return struct.pack('<I', zlib.crc32(key + value, zlib.crc32(header))) + header + key + value
+
+
+def _fsync_directory(path: str) -> None:
+    """Fsync the directory holding path, so a rename or creation in it is durable."""
+    descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def replay(path: str, map_class, function, **options):
+    """
+    Return a map_class map rebuilt from the log at path, the length of the log's valid prefix and
+    its number of records. The log is scanned once to count put records so the map is presized
+    before the second scan replays them; a torn record at the end, from a crash mid-append, ends
+    the log. A log shorter than its header, from a crash while creating it, has no valid prefix.
+    """
+    m = map_class(1, function, **options)
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < len(LOG_MAGIC):
+            return m, 0, 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if buffer[:len(LOG_MAGIC)] != LOG_MAGIC:
+                raise ValueError(f"{path} is not a HashMap log")
+
+            puts = records = 0
+            end = len(LOG_MAGIC)
+            for operation, _, _, _, end in _records(buffer, end, len(buffer)):
+                puts += operation == PUT
+                records += 1
+
+            # Grow through the resize policy rather than resize_table, which would stop the map
+            # from ever shrinking below the count of puts, overwritten and removed keys included
+            m._reserve(puts)
+
+            for operation, start, key_length, value_length, _ in _records(buffer, len(LOG_MAGIC), end):
+                key = str(buffer[start:start + key_length], 'utf-8', TEXT_ERRORS)
+                if operation == PUT:
+                    m.put(key, decode_value(buffer[start + key_length:start + key_length + value_length]))
+                else:
+                    m.remove(key)
+    return m, end, records
+
+
+class DurableHashMap:
+    """
+    A hash_map_sc or hash_map_oa HashMap whose updates are logged. Reads go
+    straight to the map. Writes return once appended; they are durable after
+    the next group commit, or immediately with fsync_interval=0. Like the
+    maps themselves, it expects updates from one thread at a time.
+    """
+
+    def __init__(self, m, path: str, fsync_interval: float = 0.05, compact_ratio: float = 2.0,
+                 log_length: int = None, log_records: int = None) -> None:
+        """
+        Log updates of map m to path, appending to the log if it exists. fsync_interval is the
+        group commit period in seconds: 0 fsyncs every write, and None leaves syncing to the OS.
+        The log is compacted when it holds more than compact_ratio records per live key (None
+        never compacts automatically). Compaction runs on the background thread: the write that
+        crosses the ratio only wakes it, and writes made while it rewrites the log are carried
+        over to the new one.
+        log_length truncates an existing log to its valid prefix first, and log_records is the
+        number of records in it (by default, assumed one per key of m).
+        """
+        self._map = m
+        self._path = path
+        self._fsync_interval = fsync_interval
+        self._compact_ratio = compact_ratio
+        self._records = m.get_size() if log_records is None else log_records
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._file = self._open_log(log_length)
+
+        # Records appended while a compaction writes the new log, to be copied into it
+        self._compacting = threading.Lock()
+        self._carried = None
+        self._compact_due = False
+
+        self._closed = False
+        self._wake = threading.Event()
+        self._worker = None
+        if fsync_interval or compact_ratio is not None:
+            self._worker = threading.Thread(target=self._run_background, daemon=True)
+            self._worker.start()
+
+    @classmethod
+    def open(cls, path: str, map_class, function, fsync_interval: float = 0.05,
+             compact_ratio: float = 2.0, **options) -> "DurableHashMap":
+        """
+        Recover the map logged at path into a new map_class map (created empty if there is no log)
+        and keep logging to it. options are passed on to the map_class constructor.
+        """
+        if not os.path.exists(path):
+            return cls(map_class(64, function, **options), path, fsync_interval, compact_ratio)
+        m, log_length, log_records = replay(path, map_class, function, **options)
+        return cls(m, path, fsync_interval, compact_ratio, log_length, log_records)
+
+    def _open_log(self, log_length: int = None):
+        """Open the log for appending, writing its header if it is new."""
+        file = open(self._path, 'ab')
+        if log_length is not None:
+            file.truncate(log_length)
+
+        # tell() of a file opened for appending is 0 until it is written, whatever its length
+        if os.fstat(file.fileno()).st_size == 0:
+            file.write(LOG_MAGIC)
+            file.flush()
+            os.fsync(file.fileno())
+            _fsync_directory(self._path)
+        return file
+
+    @property
+    def map(self):
+        """The underlying HashMap, for reads. Updating it directly bypasses the log."""
+        return self._map
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._map.get_size()
+
+    def get(self, key: str) -> object:
+        """
+        Return value associated with given key
+        """
+        return self._map.get(key)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        If key exists, return True. Else, return False.
+        """
+        return self._map.contains_key(key)
+
+    def _append(self, record: bytes) -> None:
+        """
+        Append a record to the log, syncing now if every write must be durable. The caller holds
+        the lock.
+        """
+        self._file.write(record)
+        if self._fsync_interval == 0:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        else:
+            self._dirty = True
+        if self._carried is not None:
+            self._carried.append(record)
+        self._records += 1
+
+        if self._compact_ratio is not None and not self._compact_due and \
+                self._records > self._compact_ratio * max(self._map.get_size(), 1024):
+            self._compact_due = True
+            self._wake.set()
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Update key/value pair in hash map and log it.
+        """
+        record = _record(PUT, key, encode_value(value))
+        with self._lock:
+            self._append(record)
+            self._map.put(key, value)
+
+    def remove(self, key: str) -> None:
+        """
+        Remove given key and associated value from hash map, logging the removal if key existed.
+        """
+        with self._lock:
+            if self._map.pop(key, _MISSING) is not _MISSING:
+                self._append(_record(REMOVE, key))
+
+    def sync(self) -> None:
+        """Flush and fsync the log now, making every logged write durable."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._dirty = False
+
+    def _run_background(self) -> None:
+        """
+        Group commit and compaction loop: sync the log every fsync_interval seconds while it has
+        new writes, and compact it when a write finds it too long.
+        """
+        while not self._closed:
+            self._wake.wait(self._fsync_interval or None)
+            self._wake.clear()
+            if self._closed:
+                return
+            if self._dirty and self._fsync_interval:
+                self.sync()
+            if self._compact_due:
+                self.compact()
+
+    def compact(self) -> None:
+        """
+        Rewrite the log as one put record per live key. The live records are found by scanning
+        the log up to its current end without holding the lock or touching the map, so writes
+        continue meanwhile and are carried over to the new log. The new log is written and
+        fsynced beside the old one, then renamed over it, so a crash leaves either log intact.
+        """
+        with self._compacting:
+            with self._lock:
+                self._file.flush()
+                end = os.fstat(self._file.fileno()).st_size
+                self._carried = []
+
+            temporary = self._path + '.compact'
+            try:
+                # Keep each live key's last encoded value, without decoding it
+                live = {}
+                with open(self._path, 'rb') as log, \
+                        mmap.mmap(log.fileno(), end, access=mmap.ACCESS_READ) as buffer:
+                    for operation, start, key_length, value_length, _ in \
+                            _records(buffer, len(LOG_MAGIC), end):
+                        key = buffer[start:start + key_length]
+                        if operation == PUT:
+                            live[key] = buffer[start + key_length:start + key_length + value_length]
+                        else:
+                            live.pop(key, None)
+
+                with open(temporary, 'wb') as file:
+                    file.write(LOG_MAGIC)
+                    for key, value in live.items():
+                        file.write(_encoded_record(PUT, key, value))
+                    file.flush()
+                    os.fsync(file.fileno())
+
+                with self._lock:
+                    with open(temporary, 'ab') as file:
+                        file.write(b''.join(self._carried))
+                        file.flush()
+                        os.fsync(file.fileno())
+                    self._file.close()
+                    os.replace(temporary, self._path)
+                    _fsync_directory(self._path)
+                    self._file = self._open_log()
+                    self._dirty = False
+                    self._records = len(live) + len(self._carried)
+            finally:
+                with self._lock:
+                    self._carried = None
+                    self._compact_due = False
+
+    def close(self) -> None:
+        """Stop the background thread, sync the log and close it."""
+        self._closed = True
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join()
+        self.sync()
+        self._file.close()
+
+    def __enter__(self) -> "DurableHashMap":
+        """Return the map itself, so it can be used in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the map on leaving a with statement."""
+        self.close()
@@ -0,0 +1,227 @@
+# Description: A flat binary open addressing hash table that can be read in
+#              place from any buffer (bytes, shared memory, mmap) without
+#              deserializing it. The layout is a fixed-size header, a slot
+#              table of fixed-width records and a heap of key/value bytes:
+#
+#                header  magic, capacity, size, total length, hash function
+#                        name, hash function fingerprint
+#                slots   capacity x (hash, heap offset, key length, value length)
+#                heap    UTF-8 key bytes followed by encoded value bytes
+#
+#              Slots are probed with the triangular sequence of
+#              probing.QuadraticProbing over a power-of-two capacity. A slot
+#              with heap offset 0 is empty, since the heap follows the header.
+
+import pickle
+import struct
+
+from hash_functions import HASH_MASK, MIX_MULTIPLIER_1
+from probing import next_power_of_two
+
+MAGIC = b'HMFLAT02'
+HEADER = struct.Struct('<8sQQQ32sQ')
+SLOT = struct.Struct('<QQII')
+
+# Keys whose hash codes fingerprint a hash function. Tables are only read with a function that
+# hashes them as the writer's did, which catches the built-in hash seeded in another process.
+FINGERPRINT_KEYS = ('a', 'flat table', 'hash function fingerprint', '\u00e9\u4e2d\U0001f600')
+
+# Lone surrogates are valid in str keys, so text is encoded with surrogatepass
+TEXT_ERRORS = 'surrogatepass'
+
+# Highest load factor of a table written by encode
+DEFAULT_LOAD_FACTOR = 0.5
+
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+
+
+def hash_fingerprint(function) -> int:
+    """Return a 64-bit fingerprint of the hash codes function gives FINGERPRINT_KEYS."""
+    fingerprint = 0
+    for key in FINGERPRINT_KEYS:
+        fingerprint = ((fingerprint ^ (function(key) & HASH_MASK)) * MIX_MULTIPLIER_1) & HASH_MASK
+    return fingerprint
+
+
+def encode_value(value: object) -> bytes:
+    """
+    Return the bytes of a value: a one-byte type tag followed by its payload. str, bytes, 64-bit
+    int, float and None are stored directly so they can be decoded without unpickling.
+    """
+    if type(value) is str:
+        return b's' + value.encode('utf-8', TEXT_ERRORS)
+    if type(value) is bytes:
+        return b'b' + value
+    if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+        return b'i' + _INT.pack(value)
+    if type(value) is float:
+        return b'f' + _FLOAT.pack(value)
+    if value is None:
+        return b'n'
+    return b'p' + pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+def decode_value(data) -> object:
+    """Return the value encoded in a bytes-like object by encode_value."""
+    tag = data[0]
+    if tag == 0x73:     # 's'
+        return str(data[1:], 'utf-8', TEXT_ERRORS)
+    if tag == 0x62:     # 'b'
+        return bytes(data[1:])
+    if tag == 0x69:     # 'i'
+        return _INT.unpack_from(data, 1)[0]
+    if tag == 0x66:     # 'f'
+        return _FLOAT.unpack_from(data, 1)[0]
+    if tag == 0x6e:     # 'n'
+        return None
+    return pickle.loads(data[1:])
+
+
+def encode_entries(entries, function, load_factor: float = DEFAULT_LOAD_FACTOR) -> bytearray:
+    """
+    Return a flat table of (hash, key, value) entries with unique keys, where hash is the key's
+    hash code computed by function.
+    """
+    entries = [(hash & HASH_MASK, key.encode('utf-8', TEXT_ERRORS), encode_value(value))
+               for hash, key, value in entries]
+    capacity = next_power_of_two(int(len(entries) / load_factor) + 1)
+    heap_start = HEADER.size + capacity * SLOT.size
+    length = heap_start + sum(len(key) + len(value) for _, key, value in entries)
+
+    table = bytearray(length)
+    HEADER.pack_into(table, 0, MAGIC, capacity, len(entries), length, function.__name__.encode('utf-8'),
+                     hash_fingerprint(function))
+
+    mask = capacity - 1
+    offset = heap_start
+    for hash, key, value in entries:
+        index = hash & mask
+        i = 1
+        while SLOT.unpack_from(table, HEADER.size + index * SLOT.size)[1] != 0:
+            index = (index + i) & mask
+            i += 1
+        SLOT.pack_into(table, HEADER.size + index * SLOT.size, hash, offset, len(key), len(value))
+        table[offset:offset + len(key)] = key
+        table[offset + len(key):offset + len(key) + len(value)] = value
+        offset += len(key) + len(value)
+
+    return table
+
+
+def encode(pairs, function, load_factor: float = DEFAULT_LOAD_FACTOR) -> bytearray:
+    """Return a flat table of (key, value) pairs with unique keys, hashed by function."""
+    return encode_entries(((function(key), key, value) for key, value in pairs), function, load_factor)
+
+
+def encode_map(m, load_factor: float = DEFAULT_LOAD_FACTOR) -> bytearray:
+    """Return a flat table of a hash_map_oa.HashMap's entries, reusing their cached hash codes."""
+    return encode_entries(((entry.hash, entry.key, entry.value) for entry in m._entries()),
+                          m._hash_function, load_factor)
+
+
+class FlatTable:
+    """
+    Read-only view of a flat table in a buffer. Lookups unpack slots and
+    compare key bytes directly in the buffer; only a found value is decoded.
+    """
+
+    def __init__(self, buffer, function) -> None:
+        """
+        Open the flat table at the start of buffer. function must be the hash function the table
+        was written with; a table written with a differently named function, or one that hashed
+        keys differently (such as the built-in hash in another process), raises ValueError.
+        """
+        self._buffer = memoryview(buffer)
+        magic, capacity, size, length, function_name, fingerprint = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            self._buffer.release()
+            raise ValueError("buffer does not hold a flat hash table")
+        function_name = function_name.rstrip(b'\0').decode('utf-8')
+        if function_name != function.__name__:
+            self._buffer.release()
+            raise ValueError(f"table was written with hash function {function_name}, "
+                             f"not {function.__name__}")
+        if fingerprint != hash_fingerprint(function):
+            self._buffer.release()
+            raise ValueError(f"{function_name} gives different hash codes than when the table was "
+                             f"written; it must not be seeded per process")
+
+        self._capacity = capacity
+        self._size = size
+        self._length = length
+        self._hash_function = function
+
+    def get_size(self) -> int:
+        """
+        Return size of table
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of table
+        """
+        return self._capacity
+
+    def nbytes(self) -> int:
+        """Return length of the table in bytes."""
+        return self._length
+
+    def _find(self, key: str, hash: int) -> tuple:
+        """Return the (heap offset, key length, value length) of key's slot, or None if it's absent."""
+        buffer = self._buffer
+        data = key.encode('utf-8', TEXT_ERRORS)
+        mask = self._capacity - 1
+        index = hash & mask
+        for i in range(1, self._capacity + 1):
+            slot_hash, offset, key_length, value_length = SLOT.unpack_from(buffer, HEADER.size + index * SLOT.size)
+            if offset == 0:
+                return None
+            if slot_hash == hash and key_length == len(data) and buffer[offset:offset + key_length] == data:
+                return offset, key_length, value_length
+            index = (index + i) & mask
+        return None
+
+    def _get(self, key: str, hash: int) -> object:
+        """Return value of key given its masked hash code, or None."""
+        slot = self._find(key, hash)
+        if slot is None:
+            return None
+        offset, key_length, value_length = slot
+        start = offset + key_length
+        return decode_value(self._buffer[start:start + value_length])
+
+    def get(self, key: str) -> object:
+        """
+        Return value associated with given key
+        """
+        return self._get(key, self._hash_function(key) & HASH_MASK)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        If key exists, return True. Else, return False.
+        """
+        return self._find(key, self._hash_function(key) & HASH_MASK) is not None
+
+    def items(self):
+        """Return a generator over the (key, value) pairs, in slot order."""
+        buffer = self._buffer
+        for index in range(self._capacity):
+            _, offset, key_length, value_length = SLOT.unpack_from(buffer, HEADER.size + index * SLOT.size)
+            if offset != 0:
+                start = offset + key_length
+                yield (str(buffer[offset:start], 'utf-8', TEXT_ERRORS),
+                       decode_value(buffer[start:start + value_length]))
+
+    def __len__(self) -> int:
+        """Return number of keys in the table."""
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if key is in the table, so `key in table` works."""
+        return self.contains_key(key)
+
+    def release(self) -> None:
+        """Release the table's view of its buffer, so the buffer can be closed."""
+        self._buffer.release()
@@ -0,0 +1,161 @@
+# Description: Count value frequencies over streams too large to hold in
+#              memory. Input is consumed in chunks from any iterable into a
+#              separate chaining HashMap, the mode and top-k can be read
+#              between chunks, and chunks can be spread across worker
+#              processes whose per-worker maps are merged at the end.
+
+import heapq
+import multiprocessing
+import os
+from itertools import islice
+from operator import itemgetter
+
+from a6_include import DynamicArray, hash_function_1
+from hash_map_sc import HashMap, _increment
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+
+def _chunks(iterable, chunk_size: int):
+    """Yield lists of up to chunk_size items from an iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class FrequencyCounter:
+    """
+    Frequency counter backed by a separate chaining HashMap. The mode is
+    maintained incrementally as values are added, the same way find_mode
+    builds it: all values sharing the highest count, in the order they
+    reached it.
+    """
+
+    def __init__(self, function=hash_function_1, capacity: int = 64) -> None:
+        """Initialize an empty counter using the given hash function."""
+        self._counts = HashMap(capacity, function)
+        self._mode_array = DynamicArray()
+        self._mode_frequency = 0
+        self._total = 0
+
+    def add(self, value: str, count: int = 1) -> int:
+        """Add count occurrences of value and return its new count."""
+        if count == 1:
+            frequency = self._counts.update(value, _increment, 0)
+        else:
+            frequency = self._counts.update(value, lambda current: current + count, 0)
+        self._total += count
+
+        if frequency > self._mode_frequency:
+            self._mode_array = DynamicArray()
+            self._mode_array.append(value)
+            self._mode_frequency = frequency
+        elif frequency == self._mode_frequency:
+            self._mode_array.append(value)
+        return frequency
+
+    def stream(self, iterable, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Count the values of an iterable one chunk at a time, yielding the counter after each chunk
+        so mode() and top_k() can be reported while the stream is still being read.
+        """
+        for chunk in _chunks(iterable, chunk_size):
+            for value in chunk:
+                self.add(value)
+            yield self
+
+    def consume(self, iterable, chunk_size: int = DEFAULT_CHUNK_SIZE) -> "FrequencyCounter":
+        """Count every value of an iterable, reading it in chunks. Return the counter."""
+        for _ in self.stream(iterable, chunk_size):
+            pass
+        return self
+
+    def merge(self, other: "FrequencyCounter") -> "FrequencyCounter":
+        """Add every count from another counter into this one. Return this counter."""
+        for value, count in other.items():
+            self.add(value, count)
+        return self
+
+    def count(self, value: str) -> int:
+        """Return number of times value was seen."""
+        return self._counts.get(value) or 0
+
+    def mode(self) -> (DynamicArray, int):
+        """Return an array with the mode value(s) and their frequency, like find_mode."""
+        return self._mode_array, self._mode_frequency
+
+    def top_k(self, k: int) -> list:
+        """Return the k most frequent (value, count) pairs, highest count first."""
+        return heapq.nlargest(k, self._counts.items(), key=itemgetter(1))
+
+    def items(self):
+        """Return a generator over the (value, count) pairs."""
+        return self._counts.items()
+
+    def distinct(self) -> int:
+        """Return number of distinct values seen."""
+        return self._counts.get_size()
+
+    def total(self) -> int:
+        """Return number of values seen."""
+        return self._total
+
+
+def _count_worker(chunks, results, function) -> None:
+    """
+    Worker process: count every chunk taken from the chunks queue into one map until a None
+    sentinel arrives, then put the map's (value, count) pairs, or the exception raised, on results.
+    """
+    try:
+        counts = HashMap(64, function)
+        for chunk in iter(chunks.get, None):
+            for value in chunk:
+                counts.update(value, _increment, 0)
+        results.put(list(counts.items()))
+    except Exception as error:
+        results.put(error)
+
+
+def count_parallel(iterable, workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   function=hash_function_1) -> FrequencyCounter:
+    """
+    Count the values of an iterable across worker processes and return the merged
+    FrequencyCounter. Chunks are handed out through a bounded queue, so memory stays bounded for
+    arbitrarily long streams; each worker counts into its own map, and the per-worker maps are
+    merged once at the end. function must be picklable, i.e. defined at module level.
+    """
+    workers = workers or os.cpu_count() or 1
+    context = multiprocessing.get_context()
+    chunks = context.Queue(2 * workers)
+    results = context.Queue()
+    processes = [context.Process(target=_count_worker, args=(chunks, results, function))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    try:
+        for chunk in _chunks(iterable, chunk_size):
+            chunks.put(chunk)
+    finally:
+        for _ in processes:
+            chunks.put(None)
+
+    # Drain every result before joining, so no worker blocks on a full pipe
+    counter = FrequencyCounter(function)
+    error = None
+    for _ in processes:
+        partial = results.get()
+        if isinstance(partial, Exception):
+            error = partial
+            continue
+        for value, count in partial:
+            counter.add(value, count)
+    for process in processes:
+        process.join()
+
+    if error is not None:
+        raise error
+    return counter
@@ -0,0 +1,62 @@
+# Description: Additional hash functions for the HashMap implementations. Each
+#              takes a str key and returns an unsigned 64-bit hash code, so any
+#              of them can be passed as the function argument of a HashMap.
+
+
+HASH_MASK = (1 << 64) - 1
+
+FNV_OFFSET_BASIS = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+
+# Odd 64-bit multipliers from SplitMix64
+MIX_MULTIPLIER_1 = 0x9e3779b97f4a7c15
+MIX_MULTIPLIER_2 = 0xbf58476d1ce4e5b9
+MIX_MULTIPLIER_3 = 0x94d049bb133111eb
+
+
+def fnv1a_64(key: str) -> int:
+    """64-bit FNV-1a hash of the key's UTF-8 bytes."""
+    hash = FNV_OFFSET_BASIS
+    for byte in key.encode('utf-8'):
+        hash ^= byte
+        hash = (hash * FNV_PRIME) & HASH_MASK
+    return hash
+
+
+def make_mix_hash(seed: int = 0):
+    """
+    Return a seeded multiply-xorshift hash function. The key's UTF-8 bytes are
+    consumed eight at a time, each word multiplied into the state and folded
+    with a shift; a SplitMix64 finalizer then spreads the result over all bits.
+    Different seeds give independent functions over the same keys.
+    """
+    seed &= HASH_MASK
+
+    def mix_hash(key: str) -> int:
+        """Seeded multiply-xorshift hash of the key's UTF-8 bytes."""
+        data = key.encode('utf-8')
+        hash = (seed ^ (len(data) * MIX_MULTIPLIER_1)) & HASH_MASK
+        for i in range(0, len(data), 8):
+            hash = ((hash ^ int.from_bytes(data[i:i + 8], 'little')) * MIX_MULTIPLIER_1) & HASH_MASK
+            hash ^= hash >> 32
+
+        hash ^= hash >> 30
+        hash = (hash * MIX_MULTIPLIER_2) & HASH_MASK
+        hash ^= hash >> 27
+        hash = (hash * MIX_MULTIPLIER_3) & HASH_MASK
+        hash ^= hash >> 31
+        return hash
+
+    mix_hash.__name__ = 'mix_hash' if seed == 0 else f'mix_hash_{seed:x}'
+    return mix_hash
+
+
+mix_hash = make_mix_hash()
+
+
+def native_hash(key: str) -> int:
+    """
+    Python's built-in hash of the key as an unsigned 64-bit code. String hashes are
+    randomized per process unless PYTHONHASHSEED is set, so codes must not be persisted.
+    """
+    return hash(key) & HASH_MASK
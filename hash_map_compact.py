@@ -0,0 +1,284 @@
+# Description: Implement an open addressing hash map with a compact layout.
+#              Entries live in dense parallel arrays of hashes, keys and
+#              values in insertion order; the hash table itself is a small
+#              sparse index array whose buckets hold positions into them.
+
+
+from array import array
+
+from a6_include import (DynamicArray,
+                        hash_function_1, hash_function_2)
+from probing import QuadraticProbing
+from resize_policy import ResizePolicy
+
+# Index bucket markers: never used, and previously used by a removed entry
+EMPTY = -1
+DUMMY = -2
+
+# Hash codes are stored as unsigned 64-bit integers
+HASH_MASK = (1 << 64) - 1
+
+# Dense slot marker for a removed entry, kept until the next rebuild
+_DELETED = object()
+
+
+def _index_array(capacity: int) -> array:
+    """Return an index array of EMPTY buckets using the narrowest integer type that fits capacity."""
+    if capacity < 2 ** 7:
+        typecode = 'b'
+    elif capacity < 2 ** 15:
+        typecode = 'h'
+    elif capacity < 2 ** 31:
+        typecode = 'i'
+    else:
+        typecode = 'q'
+    return array(typecode, [EMPTY]) * capacity
+
+
+class HashMap:
+    def __init__(self, capacity: int, function, probing=None, policy: ResizePolicy = None) -> None:
+        """
+        Initialize new HashMap with a compact layout.
+        probing is a strategy from the probing module and defaults to quadratic
+        probing. policy decides when the index grows or shrinks; by default it
+        doubles when two thirds of the index buckets are in use.
+        """
+        if probing is None:
+            probing = QuadraticProbing()
+        if policy is None:
+            policy = ResizePolicy(2 / 3)
+        capacity = probing.table_capacity(capacity)
+
+        self._indices = _index_array(capacity)
+        self._hashes = array('Q')
+        self._keys = []
+        self._values = []
+
+        self._capacity = capacity
+        self._hash_function = function
+        self._probing = probing
+        self._policy = policy
+        self._min_capacity = capacity
+        self._size = 0
+        self._fill = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            position = self._indices[i]
+            if position < 0:
+                out += str(i) + ': None\n'
+            else:
+                out += f"{i}: K: {self._keys[position]} V: {self._values[position]}\n"
+        return out
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Update key/value pair in hash map. If key doesn't exist, append it to the dense arrays,
+        first rebuilding the index if too many of its buckets are in use.
+        """
+        hash = self._hash_function(key) & HASH_MASK
+
+        bucket = self._find(key, hash)
+        if bucket != -1:
+            self._values[self._indices[bucket]] = value
+            return
+
+        # Removed entries keep their dense slot until the next rebuild, so the dense length bounds
+        # the number of index buckets in use. If dropping removed entries is enough, keep the capacity.
+        new_capacity = self._policy.grow_capacity(len(self._keys), self._capacity)
+        if new_capacity is not None:
+            new_capacity = self._policy.grow_capacity(self._size, self._capacity) or self._capacity
+            self._rebuild(self._probing.table_capacity(new_capacity))
+
+        # Reuse the first dummy bucket on the probe sequence, otherwise take the empty one
+        for bucket in self._probing.probe(hash, key, self._capacity):
+            position = self._indices[bucket]
+            if position == EMPTY:
+                self._fill += 1
+                break
+            if position == DUMMY:
+                break
+
+        self._indices[bucket] = len(self._keys)
+        self._hashes.append(hash)
+        self._keys.append(key)
+        self._values.append(value)
+        self._size += 1
+
+    def _find(self, key: str, hash: int) -> int:
+        """
+        Return index bucket pointing at key, or -1 if key is not in the table.
+        The search stops at the first never-used bucket.
+        """
+        for bucket in self._probing.probe(hash, key, self._capacity):
+            position = self._indices[bucket]
+            if position == EMPTY:
+                return -1
+            if position >= 0 and self._hashes[position] == hash and self._keys[position] == key:
+                return bucket
+        return -1
+
+    def table_load(self) -> float:
+        """
+        Return current hash table load factor.
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Return number of never-used buckets in the index.
+        """
+        return self._capacity - self._fill
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resize the index with given capacity, growing it further if needed to stay below the resize
+        policy's high watermark. Only the index is rebuilt; entries stay where they are, apart from
+        dropping removed ones. The map will not shrink below the new capacity.
+        """
+
+        # control for invalid capacity
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        new_capacity = self._policy.grow_capacity(self._size, new_capacity) or new_capacity
+
+        self._min_capacity = new_capacity
+        self._rebuild(self._probing.table_capacity(new_capacity))
+
+    def _rebuild(self, new_capacity: int) -> None:
+        """
+        Drop removed entries from the dense arrays and build a new index of the given capacity
+        from the cached hash codes.
+        """
+        if self._size != len(self._keys):
+            live = [i for i in range(len(self._keys)) if self._keys[i] is not _DELETED]
+            self._hashes = array('Q', [self._hashes[i] for i in live])
+            self._keys = [self._keys[i] for i in live]
+            self._values = [self._values[i] for i in live]
+
+        indices = _index_array(new_capacity)
+        for position in range(self._size):
+            key = self._keys[position]
+            for bucket in self._probing.probe(self._hashes[position], key, new_capacity):
+                if indices[bucket] == EMPTY:
+                    indices[bucket] = position
+                    break
+
+        self._indices = indices
+        self._capacity = new_capacity
+        self._fill = self._size
+
+    def get(self, key: str) -> object:
+        """
+        Return value of given key.
+        """
+        bucket = self._find(key, self._hash_function(key) & HASH_MASK)
+        if bucket == -1:
+            return None
+        return self._values[self._indices[bucket]]
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if key is in hash table.
+        """
+
+        # Control for empty hash table
+        if self._size == 0:
+            return False
+
+        return self._find(key, self._hash_function(key) & HASH_MASK) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Remove given key and associated value from hash table. If load factor drops below the
+        resize policy's low watermark, shrink the index.
+        """
+        bucket = self._find(key, self._hash_function(key) & HASH_MASK)
+        if bucket == -1:
+            return
+
+        position = self._indices[bucket]
+        self._indices[bucket] = DUMMY
+        self._keys[position] = _DELETED
+        self._values[position] = None
+        self._size -= 1
+
+        new_capacity = self._policy.shrink_capacity(self._size, self._capacity, self._min_capacity)
+        if new_capacity is not None:
+            self._rebuild(self._probing.table_capacity(new_capacity))
+
+    def clear(self) -> None:
+        """
+        Remove all elements from hash table. Capacity remains the same.
+        """
+        self._indices = _index_array(self._capacity)
+        self._hashes = array('Q')
+        self._keys = []
+        self._values = []
+        self._size = 0
+        self._fill = 0
+
+    def get_keys(self) -> DynamicArray:
+        """
+        Return array with all keys in hash table, in insertion order
+        """
+        if self._size == len(self._keys):
+            return DynamicArray(self._keys)
+        return DynamicArray([key for key in self._keys if key is not _DELETED])
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example")
+    print("-----------")
+    m = HashMap(50, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nremove example")
+    print("--------------")
+    m = HashMap(75, hash_function_2)
+    keys = [i for i in range(1, 1000, 20)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    for key in keys[::2]:
+        m.remove(str(key))
+    result = True
+    for i, key in enumerate(keys):
+        # every other key was removed, the rest must still be present
+        result &= m.contains_key(str(key)) == (i % 2 == 1)
+        # NOT inserted keys must be absent
+        result &= not m.contains_key(str(key + 1))
+    print(result, m.get_size(), m.get_capacity(), m.empty_buckets())
+
+    print("\nget_keys example")
+    print("----------------")
+    m = HashMap(10, hash_function_2)
+    for i in range(100, 200, 10):
+        m.put(str(i), str(i * 10))
+    print(m.get_keys())
+    m.remove('100')
+    m.resize_table(2)
+    print(m.get_keys())
@@ -6,24 +6,64 @@
 # Description: Implement a hash map with open addressing
 
 
+import time
+
 from a6_include import (DynamicArray, HashEntry,
                         hash_function_1, hash_function_2)
+from batch_hash import hash_many
+from map_stats import MapStats
+from probing import QuadraticProbing
+from resize_policy import ResizePolicy
 
 
 class HashMap:
-    def __init__(self, capacity: int, function) -> None:
+    def __init__(self, capacity: int, function, probing=None,
+                 compact_threshold: float = 0.75, policy: ResizePolicy = None,
+                 rehash_step: int = None, stats: bool = False) -> None:
         """
-        Initialize new HashMap that uses
-        quadratic probing for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Initialize new HashMap that uses open addressing for collision resolution.
+        probing is a strategy from the probing module and defaults to quadratic
+        probing; the strategy may round capacity up to a size it fully covers.
+        Once live entries plus tombstones fill compact_threshold of the table,
+        the next put rehashes it in place to clear the tombstones (None disables this).
+        policy decides when the table grows or shrinks; by default it doubles
+        at a load factor of 0.5 and never shrinks below the requested capacity.
+        By default a resize rehashes the whole table at once. With rehash_step,
+        resizes are progressive: the old and new bucket arrays coexist, lookups
+        consult both, and every put, get and remove moves rehash_step more old
+        buckets to the new array. With stats, the map keeps the counters returned
+        by get_stats.
         """
+        if probing is None:
+            probing = QuadraticProbing()
+        if policy is None:
+            policy = ResizePolicy(0.5)
+        capacity = probing.table_capacity(capacity)
+
         self._buckets = DynamicArray()
         for _ in range(capacity):
             self._buckets.append(None)
 
         self._capacity = capacity
         self._hash_function = function
+        self._probing = probing
+        self._compact_threshold = compact_threshold
+        self._policy = policy
+        self._min_capacity = capacity
         self._size = 0
+        self._version = 0
+        self._tombstones = 0
+
+        # Progressive rehash state: entries of the old array below _migrated have been moved. The
+        # rehash pauses while _iterators are live.
+        self._rehash_step = rehash_step
+        self._old_buckets = None
+        self._old_capacity = 0
+        self._migrated = 0
+        self._unmigrated = 0
+        self._iterators = 0
+
+        self._stats = MapStats() if stats else None
 
     def __str__(self) -> str:
         """
@@ -49,49 +89,207 @@ class HashMap:
         """
         return self._capacity
 
+    def get_tombstones(self) -> int:
+        """
+        Return number of buckets holding a tombstone
+        """
+        return self._tombstones
+
     # ------------------------------------------------------------------ #
 
     def put(self, key: str, value: object) -> None:
         """
-        Update key/value pair in hash map. If key doesn't exist, add it to hash map. If load factor is >= 0.5, resize
-        hash table.
+        Update key/value pair in hash map. If key doesn't exist, add it to hash map. If load factor is at the
+        resize policy's high watermark (0.5 by default), resize hash table.
         """
 
-        if self.table_load() >= 0.5:
-            new_capacity = self._capacity * 2
-            self.resize_table(new_capacity)
+        self._put(key, value, self._hash_function(key))
 
-        # Compute initial hash index
-        hash = self._hash_function(key)
-        hash_index = hash % self._capacity
-        probe_index = hash_index
+    def _put(self, key: str, value: object, hash: int) -> None:
+        """
+        Insert or update key/value pair using an already computed hash code.
+        """
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        self._reserve(self._size)
+        self._insert(key, value, hash, None if self._stats is None else self._stats.put_probes.record)
+
+    def _reserve(self, count: int) -> None:
+        """
+        Grow the hash table, if the resize policy requires it, so that it can take entries until it
+        holds count of them. Otherwise clear out tombstones once they fill too much of the table.
+        """
+        new_capacity = self._policy.grow_capacity(count, self._capacity)
+        if new_capacity is not None:
+            self._resize(self._probing.table_capacity(new_capacity))
 
-        # Look for available spot in hash table
-        for i in range(1, self._capacity):
+        # Too few never-used buckets are left and misses walk long chains of tombstones
+        elif self._tombstones > 0 and self._compact_threshold is not None and \
+                (count + self._tombstones) / self._capacity >= self._compact_threshold:
+            self._resize(self._capacity)
 
-            # Empty spot in array
-            if self._buckets[probe_index] is None:
-                self._buckets[probe_index] = HashEntry(key, value)
-                self._size += 1
-                return
+    def _resize(self, new_capacity: int) -> None:
+        """
+        Resize the hash table for the resize policy: at once, or by starting a progressive rehash.
+        """
+        if self._rehash_step is None:
+            self._rehash(new_capacity)
+            return
+
+        # A resize due while one is running finishes the running one first
+        self._finish_migration()
+        started = time.perf_counter()
+        self._old_buckets = self._buckets
+        self._old_capacity = self._capacity
+        self._migrated = 0
+        self._unmigrated = self._size
+        self._buckets = DynamicArray([None] * new_capacity)
+        self._capacity = new_capacity
+        self._version += 1
+        self._tombstones = 0
+        if self._stats is not None:
+            self._stats.resized(time.perf_counter() - started)
+
+    def _migrate(self, count: int) -> None:
+        """
+        Move the live entries of the next count buckets of the old array into the new one. Moved
+        entries stay in the old array, so its probe sequences still end where they used to.
+        """
+        started = time.perf_counter()
+        old_buckets = self._old_buckets
+        end = min(self._migrated + count, self._old_capacity)
+        for i in range(self._migrated, end):
+            entry = old_buckets[i]
+            if entry is None or entry.is_tombstone is True:
+                continue
+
+            # The key is in neither array's probe sequence yet, so any free spot will do
+            for probe_index in self._probing.probe(entry.hash, entry.key, self._capacity,
+                                                   entry.step):
+                spot = self._buckets[probe_index]
+                if spot is None or spot.is_tombstone is True:
+                    if spot is not None:
+                        self._tombstones -= 1
+                    self._buckets[probe_index] = entry
+                    break
+            self._unmigrated -= 1
+        self._migrated = end
+
+        if end == self._old_capacity:
+            self._old_buckets = None
+        if self._stats is not None:
+            self._stats.resize_seconds += time.perf_counter() - started
+
+    def _finish_migration(self) -> None:
+        """
+        Complete a running progressive rehash.
+        """
+        if self._old_buckets is not None:
+            self._migrate(self._old_capacity)
+
+    def _find_old(self, key: str, hash: int, step: int = None) -> HashEntry:
+        """
+        Return key's live entry if it is still waiting in the old array of a progressive rehash,
+        or None. step is the key's probe step, if already computed.
+        """
+        if self._old_buckets is None:
+            return None
+        for probe_index in self._probing.probe(hash, key, self._old_capacity, step):
+            entry = self._old_buckets[probe_index]
+            if entry is None:
+                return None
+            if probe_index >= self._migrated and entry.is_tombstone is False and \
+                    entry.hash == hash and entry.key == key:
+                return entry
+        return None
+
+    def _insert(self, key: str, value: object, hash: int, record=None) -> None:
+        """
+        Insert or update key/value pair without checking the load factor. record, if given, is
+        called with the number of buckets probed.
+        """
+        step = self._probing.step(hash, key)
+        index = self._locate(key, hash, record, step)
+        entry = self._buckets[index]
+
+        # Duplicate key, update value
+        if entry is not None and entry.is_tombstone is False:
+            entry.value = value
+            return
+
+        entry = self._find_old(key, hash, step)
+        if entry is not None:
+            entry.value = value
+        else:
+            self._add(index, key, value, hash, step)
+
+    def _locate(self, key: str, hash: int, record=None, step: int = None) -> int:
+        """
+        Return index of the bucket holding key or, if key is not in the table, of the bucket a new
+        entry for it should go in. The bucket holds a live entry only in the first case. record,
+        if given, is called with the number of buckets probed. step is the key's probe step, if
+        already computed.
+        """
+
+        # Walk the probe sequence until the key or a never-used spot is found, remembering the
+        # first tombstone so the new entry can reuse it.
+        free_index = -1
+        probes = 0
+        for probe_index in self._probing.probe(hash, key, self._capacity, step):
+            probes += 1
+            entry = self._buckets[probe_index]
+
+            # Empty spot in array, key is not in the table
+            if entry is None:
+                if free_index == -1:
+                    free_index = probe_index
+                break
 
             # Tombstone in array
-            if self._buckets[probe_index].is_tombstone is True:
-                self._buckets[probe_index] = HashEntry(key, value)
-                self._size += 1
-                return
+            if entry.is_tombstone is True:
+                if free_index == -1:
+                    free_index = probe_index
 
-            # Duplicate key, update value
-            if self._buckets[probe_index].key == key:
-                self._buckets[probe_index].value = value
-                return
+            # Key found
+            elif entry.hash == hash and entry.key == key:
+                free_index = probe_index
+                break
 
-            # Update probe index using quadratic probing
-            probe_index = hash_index + (i ** 2)
+        if record is not None:
+            record(probes)
+        return free_index
 
-            # If index goes off end of array, wrap around to beginning
-            if probe_index > (self.get_capacity() - 1):
-                probe_index = probe_index % self._capacity
+    def _add(self, index: int, key: str, value: object, hash: int, step: int = None) -> None:
+        """
+        Store a new entry in a bucket returned by _locate for a missing key, caching its hash code
+        and probe step.
+        """
+        if self._buckets[index] is not None:
+            self._tombstones -= 1
+        self._buckets[index] = HashEntry(key, value, hash, step)
+        self._size += 1
+        self._version += 1
+
+    def _find(self, key: str, hash: int, record=None) -> int:
+        """
+        Return index of the bucket holding key, or -1 if key is not in the table.
+        The search stops at the first never-used bucket. record, if given, is called
+        with the number of buckets probed.
+        """
+        index = -1
+        probes = 0
+        for probe_index in self._probing.probe(hash, key, self._capacity):
+            probes += 1
+            entry = self._buckets[probe_index]
+            if entry is None:
+                break
+            if entry.is_tombstone is False and entry.hash == hash and entry.key == key:
+                index = probe_index
+                break
+
+        if record is not None:
+            record(probes)
+        return index
 
     def table_load(self) -> float:
         """
@@ -101,54 +299,72 @@ class HashMap:
 
     def empty_buckets(self) -> int:
         """
-        Return number of empty buckets in hash table.
+        Return number of empty buckets in hash table. Tombstones are not empty. During a progressive
+        rehash, entries still waiting in the old array are not counted as filling the new one.
         """
-        return self._capacity - self._size
+        return self._capacity - (self._size - self._unmigrated) - self._tombstones
 
     def resize_table(self, new_capacity: int) -> None:
         """
-        Resize hash table with given capacity. All existing entries will be rehashed.
+        Resize hash table with given capacity. All existing entries will be rehashed
+        using their cached hash codes. If the requested capacity would leave the load factor
+        at the resize policy's high watermark, it is grown until it doesn't. The probing strategy
+        may round the capacity up further. The map will not shrink below the new capacity.
         """
 
         # control for invalid capacity
         if new_capacity < 1 or new_capacity < self._size:
             return
 
-        new_hash_table = HashMap(new_capacity, self._hash_function)
+        # Size the table once for the final load instead of growing during the rehash
+        new_capacity = self._policy.grow_capacity(self._size, new_capacity) or new_capacity
+
+        self._min_capacity = new_capacity
+        self._rehash(self._probing.table_capacity(new_capacity))
+
+    def _rehash(self, new_capacity: int) -> None:
+        """
+        Move every live entry into a new bucket array of the given capacity. Entry objects are
+        reused as-is and tombstones are dropped; no load checks are made and no new entries are
+        allocated, so a rehash can never trigger another resize.
+        """
+        self._finish_migration()
+        started = time.perf_counter()
+
+        # Pre-size the new bucket array in one allocation
+        new_buckets = DynamicArray([None] * new_capacity)
 
         for i in range(self._capacity):
             entry = self._buckets[i]
-            if entry is not None and entry.is_tombstone is False:
-                new_hash_table.put(entry.key, entry.value)
-
-        self._buckets = new_hash_table._buckets
-        self._capacity = new_hash_table._capacity
+            if entry is None or entry.is_tombstone is True:
+                continue
+
+            # Keys are unique, so the entry goes into the first empty spot of its probe sequence
+            for probe_index in self._probing.probe(entry.hash, entry.key, new_capacity, entry.step):
+                if new_buckets[probe_index] is None:
+                    new_buckets[probe_index] = entry
+                    break
+
+        self._buckets = new_buckets
+        self._capacity = new_capacity
+        self._version += 1
+        self._tombstones = 0
+        if self._stats is not None:
+            self._stats.resized(time.perf_counter() - started)
 
     def get(self, key: str) -> object:
         """
         Return value of given key.
         """
-
-        # Compute initial hash index
         hash = self._hash_function(key)
-        hash_index = hash % self._capacity
-        probe_index = hash_index
-
-        # Look for key in array
-        for i in range(self._capacity):
-
-            # If key is found at initial hash index, return value
-            if self._buckets[probe_index] is not None and self._buckets[probe_index].key == key and self._buckets[probe_index].is_tombstone is False:
-                return self._buckets[probe_index].value
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
 
-            # If key is not found, update probe index using quadratic probing
-            probe_index = hash_index + (i ** 2)
-
-            # If index goes off end of array, wrap around to beginning
-            if probe_index > (self.get_capacity() - 1):
-                probe_index = probe_index % self._capacity
-
-        return None
+        index = self._find(key, hash, None if self._stats is None else self._stats.get_probes.record)
+        if index != -1:
+            return self._buckets[index].value
+        entry = self._find_old(key, hash)
+        return None if entry is None else entry.value
 
     def contains_key(self, key: str) -> bool:
         """
@@ -159,52 +375,107 @@ class HashMap:
         if self._size == 0:
             return False
 
-        # Compute initial hash index
         hash = self._hash_function(key)
-        hash_index = hash % self._capacity
-        probe_index = hash_index
-
-        # Look for spot to place to hash entry
-        for i in range(self._capacity):
-
-            # Return True if key found
-            if self._buckets[probe_index] is not None and self._buckets[probe_index].key == key and self._buckets[probe_index].is_tombstone is False:
-                return True
-
-            # Update probe index using quadratic probing
-            probe_index = hash_index + (i ** 2)
-
-            # If index goes off end of array, wrap around to beginning
-            if probe_index > (self.get_capacity() - 1):
-                probe_index = probe_index % self._capacity
-
-        return False
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        return self._find(key, hash) != -1 or self._find_old(key, hash) is not None
 
     def remove(self, key: str) -> None:
         """
-        Remove given key and associated value from hash table.
+        Remove given key and associated value from hash table. If load factor drops below the
+        resize policy's low watermark, shrink hash table.
         """
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        if self._remove(key, self._hash_function(key)) is not None:
+            self._shrink()
 
-        # Compute initial hash index
+    def _remove(self, key: str, hash: int) -> HashEntry:
+        """
+        Replace key's entry with a tombstone. Return the entry, or None if key was not in the table.
+        """
+        index = self._find(key, hash)
+        if index != -1:
+            entry = self._buckets[index]
+            self._tombstones += 1
+        else:
+            # Entries still in the old array of a progressive rehash are dropped when it's discarded
+            entry = self._find_old(key, hash)
+            if entry is None:
+                return None
+            self._unmigrated -= 1
+
+        entry.is_tombstone = True
+        self._size -= 1
+        self._version += 1
+        return entry
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Return value of given key. If key doesn't exist, add it with the default value and return
+        that. The probe sequence is walked once.
+        """
         hash = self._hash_function(key)
-        hash_index = hash % self._capacity
-        probe_index = hash_index
-
-        # Look for spot to place to hash entry
-        for i in range(self._capacity):
-
-            # Remove key/value pair if key is found
-            if self._buckets[probe_index] is not None and self._buckets[probe_index].key == key and self._buckets[probe_index].is_tombstone is False:
-                self._buckets[probe_index].is_tombstone = True
-                self._size -= 1
-                return
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        self._reserve(self._size)
+
+        step = self._probing.step(hash, key)
+        index = self._locate(key, hash, None, step)
+        entry = self._buckets[index]
+        if entry is not None and entry.is_tombstone is False:
+            return entry.value
+        entry = self._find_old(key, hash, step)
+        if entry is not None:
+            return entry.value
+
+        self._add(index, key, default, hash, step)
+        return default
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Remove given key and return its value, or return default if key doesn't exist.
+        """
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        entry = self._remove(key, self._hash_function(key))
+        if entry is None:
+            return default
 
-            # Update probe index using quadratic probing
-            probe_index = hash_index + (i ** 2)
+        self._shrink()
+        return entry.value
 
-            # If index goes off end of array, wrap around to beginning
-            if probe_index > (self.get_capacity() - 1):
-                probe_index = probe_index % self._capacity
+    def update(self, key: str, function, default: object = None) -> object:
+        """
+        Replace the value of given key with function(value), or add the key with function(default)
+        if it doesn't exist. Return the new value. The probe sequence is walked once, which makes
+        this the fast way to maintain counters.
+        """
+        hash = self._hash_function(key)
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        self._reserve(self._size)
+
+        step = self._probing.step(hash, key)
+        index = self._locate(key, hash, None, step)
+        entry = self._buckets[index]
+        if entry is None or entry.is_tombstone is True:
+            entry = self._find_old(key, hash, step)
+        if entry is not None and entry.is_tombstone is False:
+            entry.value = function(entry.value)
+            return entry.value
+
+        value = function(default)
+        self._add(index, key, value, hash, step)
+        return value
+
+    def _shrink(self) -> None:
+        """
+        Shrink the hash table if its load factor is below the resize policy's low watermark.
+        """
+        new_capacity = self._policy.shrink_capacity(self._size, self._capacity, self._min_capacity)
+        if new_capacity is not None:
+            self._resize(self._probing.table_capacity(new_capacity))
 
     def clear(self) -> None:
         """
@@ -214,7 +485,11 @@ class HashMap:
         for _ in range(self._capacity):
             self._buckets.append(None)
 
+        self._old_buckets = None
+        self._unmigrated = 0
         self._size = 0
+        self._version += 1
+        self._tombstones = 0
 
     def get_keys(self) -> DynamicArray:
         """
@@ -225,13 +500,203 @@ class HashMap:
         key_array = DynamicArray()
 
         # iterate through all keys in hashmap and append to key_array
-        for i in range(self._capacity):
-            if self._buckets[i] is not None and self._buckets[i].is_tombstone is False:
-                key_array.append(self._buckets[i].key)
+        for buckets, start, end in self._arrays():
+            for i in range(start, end):
+                if buckets[i] is not None and buckets[i].is_tombstone is False:
+                    key_array.append(buckets[i].key)
 
         # return key_array
         return key_array
 
+    def _arrays(self) -> list:
+        """
+        Return (buckets, start, end) for each range of bucket indices holding live entries of their
+        own: the whole new array and, during a progressive rehash, the old array from the first
+        bucket not yet moved.
+        """
+        arrays = [(self._buckets, 0, self._capacity)]
+        if self._old_buckets is not None:
+            arrays.append((self._old_buckets, self._migrated, self._old_capacity))
+        return arrays
+
+    def _entries(self):
+        """
+        Yield each live entry, walking the buckets lazily. Raise RuntimeError if a key is added or
+        removed, or the table is resized or cleared, while iterating. A running progressive rehash
+        is paused until the iteration ends, and its old buckets are walked after the new ones.
+        """
+        version = self._version
+        self._iterators += 1
+        try:
+            for buckets, start, end in self._arrays():
+                for i in range(start, end):
+                    if self._version != version:
+                        raise RuntimeError("HashMap changed during iteration")
+                    entry = buckets[i]
+                    if entry is not None and entry.is_tombstone is False:
+                        yield entry
+            if self._version != version:
+                raise RuntimeError("HashMap changed during iteration")
+        finally:
+            self._iterators -= 1
+
+    def keys(self):
+        """
+        Return a generator over the keys in the hash table, without copying them.
+        """
+        return (entry.key for entry in self._entries())
+
+    def values(self):
+        """
+        Return a generator over the values in the hash table, without copying them.
+        """
+        return (entry.value for entry in self._entries())
+
+    def items(self):
+        """
+        Return a generator over the (key, value) pairs in the hash table, without copying them.
+        """
+        return ((entry.key, entry.value) for entry in self._entries())
+
+    def __iter__(self):
+        """
+        Iterate over the keys in the hash table.
+        """
+        return self.keys()
+
+    def __len__(self) -> int:
+        """
+        Return size of map.
+        """
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Support the in operator for keys.
+        """
+        return self.contains_key(key)
+
+    def put_many(self, pairs) -> None:
+        """
+        Put every (key, value) pair from an iterable. The hash table is grown at most once, up front,
+        for the final count, and all keys are hashed in one batch.
+        """
+        pairs = list(pairs)
+        hashes = hash_many([pair[0] for pair in pairs], self._hash_function)
+
+        # Size for the case where every key is new
+        self._reserve(self._size + len(pairs))
+        record = None if self._stats is None else self._stats.put_probes.record
+        for (key, value), hash in zip(pairs, hashes):
+            if self._old_buckets is not None and self._iterators == 0:
+                self._migrate(self._rehash_step)
+            self._insert(key, value, hash, record)
+
+    def get_many(self, keys) -> list:
+        """
+        Return a list with the value of each key in an iterable, or None for missing keys.
+        """
+        keys = list(keys)
+        record = None if self._stats is None else self._stats.get_probes.record
+        values = []
+        for key, hash in zip(keys, hash_many(keys, self._hash_function)):
+            if self._old_buckets is not None and self._iterators == 0:
+                self._migrate(self._rehash_step)
+            index = self._find(key, hash, record)
+            if index != -1:
+                values.append(self._buckets[index].value)
+            else:
+                entry = self._find_old(key, hash)
+                values.append(None if entry is None else entry.value)
+        return values
+
+    def remove_many(self, keys) -> None:
+        """
+        Remove every key in an iterable. The hash table is shrunk at most once, at the end.
+        """
+        keys = list(keys)
+        removed = False
+        for key, hash in zip(keys, hash_many(keys, self._hash_function)):
+            if self._old_buckets is not None and self._iterators == 0:
+                self._migrate(self._rehash_step)
+            removed |= self._remove(key, hash) is not None
+        if removed:
+            self._shrink()
+
+    @classmethod
+    def from_dict(cls, mapping, function, load_factor: float = None, **options) -> "HashMap":
+        """
+        Return a new HashMap holding every key/value pair of a mapping.
+        See from_pairs for load_factor and options.
+        """
+        return cls._build(list(mapping.items()), function, load_factor, options, unique=True)
+
+    @classmethod
+    def from_pairs(cls, pairs, function, load_factor: float = None, **options) -> "HashMap":
+        """
+        Return a new HashMap holding every (key, value) pair of an iterable; later pairs win for
+        repeated keys. The capacity is computed once for the target load_factor (the resize policy's
+        high watermark by default, and never above it) and the buckets are filled directly, without
+        put(). options are passed on to the constructor.
+        """
+        return cls._build(list(pairs), function, load_factor, options, unique=False)
+
+    @classmethod
+    def from_arrays(cls, keys: DynamicArray, values: DynamicArray, function,
+                    load_factor: float = None, **options) -> "HashMap":
+        """
+        Return a new HashMap pairing each key of one DynamicArray with the value at the same index
+        of another. See from_pairs for load_factor and options.
+        """
+        if keys.length() != values.length():
+            raise ValueError("keys and values must have the same length")
+        pairs = [(keys[i], values[i]) for i in range(keys.length())]
+        return cls._build(pairs, function, load_factor, options, unique=False)
+
+    @classmethod
+    def _build(cls, pairs: list, function, load_factor: float, options: dict, unique: bool) -> "HashMap":
+        """
+        Return a new HashMap sized for pairs and filled with them.
+        """
+        m = cls(1, function, **options)
+        if load_factor is None:
+            capacity = m._policy.capacity_for(len(pairs))
+        else:
+            capacity = int(len(pairs) / load_factor) + 1
+
+        # Size through _rehash, not resize_table, so the map can still shrink to its initial capacity
+        capacity = m._policy.grow_capacity(len(pairs), capacity) or capacity
+        m._rehash(m._probing.table_capacity(capacity))
+
+        hashes = hash_many([pair[0] for pair in pairs], function)
+        for (key, value), hash in zip(pairs, hashes):
+
+            # Keys of a mapping are unique, so each entry goes into the first empty spot of its
+            # probe sequence; pairs go through the duplicate check in _insert
+            if not unique:
+                m._insert(key, value, hash)
+                continue
+            step = m._probing.step(hash, key)
+            for probe_index in m._probing.probe(hash, key, m._capacity, step):
+                if m._buckets[probe_index] is None:
+                    m._buckets[probe_index] = HashEntry(key, value, hash, step)
+                    break
+            m._size += 1
+        return m
+
+    def get_stats(self) -> dict:
+        """
+        Return a snapshot of the map's statistics as a dict, or None if it was created without
+        stats. Every counter is kept up to date as the map changes, so this is O(1).
+        """
+        if self._stats is None:
+            return None
+
+        snapshot = self._stats.snapshot()
+        snapshot.update(size=self._size, capacity=self._capacity, load=self._size / self._capacity,
+                        empty_buckets=self.empty_buckets(), tombstones=self._tombstones)
+        return snapshot
+
 # ------------------- BASIC TESTING ---------------------------------------- #
 
 if __name__ == "__main__":
@@ -0,0 +1,257 @@
+# Description: Implement a hash map with open addressing using Robin Hood
+#              hashing. Each bucket tracks how far its entry sits from its
+#              home bucket; inserts displace entries that are closer to home,
+#              and removals shift the following entries back, so the table
+#              never holds tombstones.
+
+
+from a6_include import (DynamicArray, HashEntry,
+                        hash_function_1, hash_function_2)
+
+
+class HashMap:
+    def __init__(self, capacity: int, function, max_load: float = 0.9) -> None:
+        """
+        Initialize new HashMap that uses Robin Hood linear probing
+        for collision resolution. The table grows when an insert would push
+        the load factor above max_load.
+        """
+        capacity = max(1, capacity)
+        self._buckets = DynamicArray([None] * capacity)
+        self._distances = DynamicArray([-1] * capacity)
+
+        self._capacity = capacity
+        self._hash_function = function
+        self._max_load = max_load
+        self._size = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._buckets.length()):
+            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        return out
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Update key/value pair in hash map. If key doesn't exist, add it to hash map. If the insert would
+        push the load factor above max_load, double the hash table first.
+        """
+        hash = self._hash_function(key)
+
+        index = self._find(key, hash)
+        if index != -1:
+            self._buckets[index].value = value
+            return
+
+        if (self._size + 1) / self._capacity > self._max_load:
+            self._rehash(self._capacity * 2)
+
+        self._place(HashEntry(key, value, hash))
+        self._size += 1
+
+    def _place(self, entry: HashEntry) -> None:
+        """
+        Insert an entry whose key is known to be absent. Walking the probe sequence, the entry being
+        carried swaps places with any entry that sits closer to its home bucket.
+        """
+        index = entry.hash % self._capacity
+        distance = 0
+
+        while True:
+            resident = self._buckets[index]
+
+            # Empty spot in array
+            if resident is None:
+                self._buckets[index] = entry
+                self._distances[index] = distance
+                return
+
+            # Resident is closer to home than the carried entry: take its spot and carry it on
+            resident_distance = self._distances[index]
+            if resident_distance < distance:
+                self._buckets[index] = entry
+                self._distances[index] = distance
+                entry, distance = resident, resident_distance
+
+            index += 1
+            if index == self._capacity:
+                index = 0
+            distance += 1
+
+    def _find(self, key: str, hash: int) -> int:
+        """
+        Return index of the bucket holding key, or -1 if key is not in the table. The search
+        stops at an empty bucket or once it is further from home than the bucket's entry.
+        """
+        index = hash % self._capacity
+
+        for distance in range(self._capacity):
+            entry = self._buckets[index]
+            if entry is None or self._distances[index] < distance:
+                return -1
+            if entry.hash == hash and entry.key == key:
+                return index
+
+            index += 1
+            if index == self._capacity:
+                index = 0
+
+        return -1
+
+    def table_load(self) -> float:
+        """
+        Return current hash table load factor.
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Return number of empty buckets in hash table.
+        """
+        return self._capacity - self._size
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resize hash table with given capacity. All existing entries will be rehashed
+        using their cached hash codes.
+        """
+
+        # control for invalid capacity
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        self._rehash(new_capacity)
+
+    def _rehash(self, new_capacity: int) -> None:
+        """
+        Move every entry into a new bucket array of the given capacity, reusing the entry objects.
+        """
+        old_buckets, old_capacity = self._buckets, self._capacity
+
+        self._buckets = DynamicArray([None] * new_capacity)
+        self._distances = DynamicArray([-1] * new_capacity)
+        self._capacity = new_capacity
+
+        for i in range(old_capacity):
+            entry = old_buckets[i]
+            if entry is not None:
+                self._place(entry)
+
+    def get(self, key: str) -> object:
+        """
+        Return value of given key.
+        """
+        index = self._find(key, self._hash_function(key))
+        if index == -1:
+            return None
+        return self._buckets[index].value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if key is in hash table.
+        """
+
+        # Control for empty hash table
+        if self._size == 0:
+            return False
+
+        return self._find(key, self._hash_function(key)) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Remove given key and associated value from hash table. The entries following it are
+        shifted back one bucket until an empty bucket or an entry already in its home bucket.
+        """
+        index = self._find(key, self._hash_function(key))
+        if index == -1:
+            return
+
+        for _ in range(self._capacity - 1):
+            next_index = index + 1
+            if next_index == self._capacity:
+                next_index = 0
+
+            distance = self._distances[next_index]
+            if self._buckets[next_index] is None or distance == 0:
+                break
+
+            self._buckets[index] = self._buckets[next_index]
+            self._distances[index] = distance - 1
+            index = next_index
+
+        self._buckets[index] = None
+        self._distances[index] = -1
+        self._size -= 1
+
+    def clear(self) -> None:
+        """
+        Remove all elements from hash table. Capacity remains the same.
+        """
+        self._buckets = DynamicArray([None] * self._capacity)
+        self._distances = DynamicArray([-1] * self._capacity)
+        self._size = 0
+
+    def get_keys(self) -> DynamicArray:
+        """
+        Return array with all keys in hash table
+        """
+        key_array = DynamicArray()
+        for i in range(self._capacity):
+            if self._buckets[i] is not None:
+                key_array.append(self._buckets[i].key)
+        return key_array
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput example")
+    print("-----------")
+    m = HashMap(50, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+
+    print("\nremove example")
+    print("--------------")
+    m = HashMap(75, hash_function_2)
+    keys = [i for i in range(1, 1000, 20)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    for key in keys[::2]:
+        m.remove(str(key))
+    result = True
+    for i, key in enumerate(keys):
+        # every other key was removed, the rest must still be present
+        result &= m.contains_key(str(key)) == (i % 2 == 1)
+        # NOT inserted keys must be absent
+        result &= not m.contains_key(str(key + 1))
+    print(result, m.get_size(), m.get_capacity(), m.empty_buckets())
+
+    print("\nget_keys example")
+    print("----------------")
+    m = HashMap(10, hash_function_2)
+    for i in range(100, 200, 10):
+        m.put(str(i), str(i * 10))
+    print(m.get_keys())
+    m.resize_table(10)
+    m.remove('100')
+    print(m.get_keys())
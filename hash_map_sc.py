@@ -6,24 +6,55 @@
 # Description: Implement a hash map with chaining
 
 
+import time
+
 from a6_include import (DynamicArray, LinkedList,
                         hash_function_1, hash_function_2)
+from batch_hash import hash_many
+from map_stats import MapStats
+from resize_policy import ResizePolicy
 
 
 class HashMap:
-    def __init__(self, capacity: int, function) -> None:
+    def __init__(self, capacity: int, function, policy: ResizePolicy = None,
+                 rehash_step: int = None, stats: bool = False) -> None:
         """
         Initialize new HashMap that uses
-        separate chaining for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        separate chaining for collision resolution.
+        policy decides when the table grows or shrinks; by default it doubles
+        at a load factor of 1.0 and halves below 0.25, never going below the
+        requested capacity.
+        By default a resize rehashes the whole table at once. With rehash_step,
+        resizes are progressive: the old and new bucket arrays coexist, and every
+        put, get and remove moves rehash_step more old buckets to the new array.
+        With stats, the map keeps the counters returned by get_stats.
         """
+        if policy is None:
+            policy = ResizePolicy(1.0, 0.25)
+
         self._buckets = DynamicArray()
         for _ in range(capacity):
             self._buckets.append(LinkedList())
 
         self._capacity = capacity
         self._hash_function = function
+        self._policy = policy
+        self._min_capacity = capacity
         self._size = 0
+        self._version = 0
+
+        # Progressive rehash state: buckets of the old array below _migrated have been moved, and
+        # chains of the new array below _allocated have been created. _old_chains counts the
+        # non-empty chains not yet moved, with stats. The rehash pauses while _iterators are live.
+        self._rehash_step = rehash_step
+        self._old_buckets = None
+        self._old_capacity = 0
+        self._migrated = 0
+        self._allocated = 0
+        self._old_chains = 0
+        self._iterators = 0
+
+        self._stats = MapStats() if stats else None
 
     def __str__(self) -> str:
         """
@@ -53,31 +84,130 @@ class HashMap:
 
     def put(self, key: str, value: object) -> None:
         """
-        Update key/value pair in hash map. If key doesn't exist, add it to hash map.
+        Update key/value pair in hash map. If key doesn't exist, add it to hash map, first growing
+        the hash table if its load factor is at the resize policy's high watermark.
         """
 
-        # Compute hash index
+        # Compute hash and find the key's chain
         hash = self._hash_function(key)
-        hash_index = hash % self._capacity
-
-        bucket = self._buckets[hash_index]
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        bucket = self._chain(hash)
 
         # If index already has items, check if key exists and update. Else, insert new node.
-        matching_key = bucket.contains(key)
+        matching_key = bucket.contains(key, hash,
+                                       None if self._stats is None else self._stats.put_probes.record)
         if matching_key is not None:
             matching_key.value = value
-        else:
-            bucket.insert(key, value)
-            self._size += 1
+            return
+
+        self._insert_new(bucket, key, value, hash)
+
+    def _reserve(self, count: int) -> bool:
+        """
+        Grow the hash table, if the resize policy requires it, so that it can take new keys until
+        it holds count of them. Return True if the table was resized.
+        """
+        new_capacity = self._policy.grow_capacity(count, self._capacity)
+        if new_capacity is None:
+            return False
+        self._resize(new_capacity)
+        return True
+
+    def _chain(self, hash: int) -> LinkedList:
+        """
+        Return the chain that holds the key with the given hash code, or that a new key with it goes
+        in. While a progressive rehash is running, that is the key's old bucket until the bucket has
+        been moved, and its bucket in the new array afterwards.
+        """
+        if self._old_buckets is not None:
+            old_index = hash % self._old_capacity
+            if old_index >= self._migrated:
+                return self._old_buckets[old_index]
+
+        hash_index = hash % self._capacity
+        bucket = self._buckets[hash_index]
+        if bucket is None:
+            bucket = LinkedList()
+            self._buckets[hash_index] = bucket
+        return bucket
+
+    def _resize(self, new_capacity: int) -> None:
+        """
+        Resize the hash table for the resize policy: at once, or by starting a progressive rehash.
+        """
+        if self._rehash_step is None:
+            self._rehash(new_capacity)
+            return
+
+        # A resize due while one is running finishes the running one first
+        self._finish_migration()
+        started = time.perf_counter()
+        self._old_buckets = self._buckets
+        self._old_capacity = self._capacity
+        self._migrated = 0
+        self._allocated = 0
+        self._buckets = DynamicArray([None] * new_capacity)
+        self._capacity = new_capacity
+        self._version += 1
+        if self._stats is not None:
+            self._old_chains = self._stats.nonempty_chains()
+            self._stats.resized(time.perf_counter() - started)
+
+    def _migrate(self, count: int) -> None:
+        """
+        Move the next count buckets of the old array into the new one, and create the new array's
+        chains at the same pace, so both are done when the last old bucket has been moved.
+        """
+        started = time.perf_counter()
+        old_buckets, buckets, capacity = self._old_buckets, self._buckets, self._capacity
+        stats = self._stats
+        end = min(self._migrated + count, self._old_capacity)
+        for i in range(self._migrated, end):
+            if stats is not None and old_buckets[i].length() > 0:
+                stats.chain_emptied(old_buckets[i].length())
+                self._old_chains -= 1
+            for node in old_buckets[i]:
+                hash_index = node.hash % capacity
+                bucket = buckets[hash_index]
+                if bucket is None:
+                    bucket = LinkedList()
+                    buckets[hash_index] = bucket
+                bucket.insert(node.key, node.value, node.hash)
+                if stats is not None:
+                    stats.chain_grew(bucket.length())
+            old_buckets[i] = None
+        self._migrated = end
+
+        allocate = -(-end * capacity // self._old_capacity)
+        for i in range(self._allocated, allocate):
+            if buckets[i] is None:
+                buckets[i] = LinkedList()
+        self._allocated = allocate
+
+        if end == self._old_capacity:
+            self._old_buckets = None
+        if stats is not None:
+            stats.resize_seconds += time.perf_counter() - started
+
+    def _finish_migration(self) -> None:
+        """
+        Complete a running progressive rehash.
+        """
+        if self._old_buckets is not None:
+            self._migrate(self._old_capacity)
 
     def empty_buckets(self) -> int:
         """
-        Returns number of empty buckets in hash table.
+        Returns number of empty buckets in hash table. With stats this is O(1). During a progressive
+        rehash, chains still waiting in the old array are not counted as filling the new one.
         """
         empty_buckets = 0
+        if self._stats is not None:
+            return self._capacity - (self._stats.nonempty_chains() - self._old_chains)
 
         for i in range(self._capacity):
-            if self._buckets[i].length() == 0:
+            if self._buckets[i] is None or self._buckets[i].length() == 0:
                 empty_buckets += 1
 
         return empty_buckets
@@ -93,45 +223,70 @@ class HashMap:
         Clear hash map of all contents.
         """
         self._buckets = DynamicArray()
+        self._old_buckets = None
+        self._old_chains = 0
         self._size = 0
+        self._version += 1
         for _ in range(self._capacity):
             self._buckets.append(LinkedList())
+        if self._stats is not None:
+            self._stats.count_chains(())
 
     def resize_table(self, new_capacity: int) -> None:
         """
-        Change capacity of hash table, rehash all existing key/value pairs.
+        Change capacity of hash table, rehash all existing key/value pairs
+        using the hash codes cached in their nodes. The map will not shrink below the new capacity.
         """
 
         # Control for invalid new_capacity
         if new_capacity < 1:
             return
 
-        # Create new hash map with new capacity
-        new_hash_map = HashMap(new_capacity, self._hash_function)
+        self._min_capacity = new_capacity
+        self._rehash(new_capacity)
+
+    def _rehash(self, new_capacity: int) -> None:
+        """
+        Move every key/value pair into a new bucket array of the given capacity.
+        """
+        self._finish_migration()
+        started = time.perf_counter()
 
-        # Put each element from the original hash map into the new hash map
+        # Create new bucket array with new capacity
+        new_buckets = DynamicArray()
+        for _ in range(new_capacity):
+            new_buckets.append(LinkedList())
+
+        # Move each element from the original buckets into the new buckets. Keys in a chain are
+        # unique, so nodes can be inserted directly without searching the new bucket first.
         for i in range(self._capacity):
             if self._buckets[i].length() > 0:
                 for node in self._buckets[i]:
-                    new_hash_map.put(node.key, node.value)
+                    new_buckets[node.hash % new_capacity].insert(node.key, node.value, node.hash)
 
-        # Replace old hash map with new hash map
+        # Replace old buckets with new buckets
         self._capacity = new_capacity
-        self._buckets = new_hash_map._buckets
+        self._version += 1
+        self._buckets = new_buckets
+
+        if self._stats is not None:
+            self._stats.count_chains(new_buckets[i].length() for i in range(new_capacity))
+            self._stats.resized(time.perf_counter() - started)
 
     def get(self, key: str) -> object:
         """
         Return value associated with given key.
         """
 
-        # Compute hash index
+        # Compute hash and find the key's chain
         hash = self._hash_function(key)
-        hash_index = hash % self._capacity
-
-        bucket = self._buckets[hash_index]
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        bucket = self._chain(hash)
 
         # If key exists, return value. Else, return none.
-        matching_key = bucket.contains(key)
+        matching_key = bucket.contains(key, hash,
+                                       None if self._stats is None else self._stats.get_probes.record)
         if matching_key is not None:
             return matching_key.value
         else:
@@ -146,14 +301,14 @@ class HashMap:
         if self._size == 0:
             return False
 
-        # Compute hash index
+        # Compute hash and find the key's chain
         hash = self._hash_function(key)
-        hash_index = hash % self._capacity
-
-        bucket = self._buckets[hash_index]
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        bucket = self._chain(hash)
 
         # If key exists, return True. Else, return False.
-        matching_key = bucket.contains(key)
+        matching_key = bucket.contains(key, hash)
         if matching_key is not None:
             return True
         else:
@@ -161,19 +316,117 @@ class HashMap:
 
     def remove(self, key: str) -> None:
         """
-        Remove given key and associated value from hash map.
+        Remove given key and associated value from hash map. If load factor drops below the
+        resize policy's low watermark, shrink hash table.
         """
-        # Compute hash index
+        # Compute hash and find the key's chain
         hash = self._hash_function(key)
-        hash_index = hash % self._capacity
-
-        bucket = self._buckets[hash_index]
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        bucket = self._chain(hash)
 
         # If key exists, remove key/value pair.
-        matching_key = bucket.contains(key)
-        if matching_key is not None:
-            bucket.remove(key)
+        if bucket.remove(key, hash):
+            if self._stats is not None:
+                self._count_chain(bucket, hash, False)
             self._size -= 1
+            self._version += 1
+            self._shrink()
+
+    def _shrink(self) -> None:
+        """
+        Shrink the hash table if its load factor is below the resize policy's low watermark.
+        """
+        new_capacity = self._policy.shrink_capacity(self._size, self._capacity, self._min_capacity)
+        if new_capacity is not None:
+            self._resize(new_capacity)
+
+    def _insert_new(self, bucket: LinkedList, key: str, value: object, hash: int) -> None:
+        """
+        Insert a key known to be missing into its bucket, growing the hash table first if the
+        resize policy requires it.
+        """
+        if self._reserve(self._size):
+            bucket = self._chain(hash)
+
+        bucket.insert(key, value, hash)
+        self._size += 1
+        self._version += 1
+        if self._stats is not None:
+            self._count_chain(bucket, hash, True)
+
+    def _count_chain(self, bucket: LinkedList, hash: int, added: bool) -> None:
+        """
+        Update the chain statistics after a key with the given hash code was added to or removed
+        from bucket, including the count of non-empty chains still waiting in the old array.
+        """
+        length = bucket.length()
+        if added:
+            self._stats.chain_grew(length)
+        else:
+            self._stats.chain_shrank(length)
+
+        # The chain just became non-empty or empty; it is in the old array until moved
+        if length == (1 if added else 0) and self._old_buckets is not None and \
+                hash % self._old_capacity >= self._migrated:
+            self._old_chains += 1 if added else -1
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Return value of given key. If key doesn't exist, add it with the default value and return
+        that. The chain is walked once.
+        """
+        hash = self._hash_function(key)
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        bucket = self._chain(hash)
+
+        matching_key = bucket.contains(key, hash)
+        if matching_key is not None:
+            return matching_key.value
+
+        self._insert_new(bucket, key, default, hash)
+        return default
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Remove given key and return its value, or return default if key doesn't exist.
+        The chain is walked once.
+        """
+        hash = self._hash_function(key)
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        bucket = self._chain(hash)
+        node = bucket.pop(key, hash)
+        if node is None:
+            return default
+        if self._stats is not None:
+            self._count_chain(bucket, hash, False)
+
+        self._size -= 1
+        self._version += 1
+        self._shrink()
+        return node.value
+
+    def update(self, key: str, function, default: object = None) -> object:
+        """
+        Replace the value of given key with function(value), or add the key with function(default)
+        if it doesn't exist. Return the new value. The chain is walked once, which makes this the
+        fast way to maintain counters.
+        """
+        hash = self._hash_function(key)
+        if self._old_buckets is not None and self._iterators == 0:
+            self._migrate(self._rehash_step)
+        bucket = self._chain(hash)
+
+        matching_key = bucket.contains(key, hash)
+        if matching_key is not None:
+            matching_key.value = function(matching_key.value)
+            return matching_key.value
+
+        value = function(default)
+        self._insert_new(bucket, key, value, hash)
+        return value
 
     def get_keys(self) -> DynamicArray:
         """
@@ -184,14 +437,236 @@ class HashMap:
         key_array = DynamicArray()
 
         # iterate through all keys in hashmap and append to key_array
-        for i in range(self._capacity):
-            if self._buckets[i].length() > 0:
-                for node in self._buckets[i]:
-                    key_array.append(node.key)
+        for buckets, start, end in self._arrays():
+            for i in range(start, end):
+                if buckets[i] is not None and buckets[i].length() > 0:
+                    for node in buckets[i]:
+                        key_array.append(node.key)
 
         # return key_array
         return key_array
 
+    def _arrays(self) -> list:
+        """
+        Return (buckets, start, end) for each range of bucket indices holding keys: the whole new
+        array and, during a progressive rehash, the buckets of the old array not yet moved.
+        """
+        arrays = [(self._buckets, 0, self._capacity)]
+        if self._old_buckets is not None:
+            arrays.append((self._old_buckets, self._migrated, self._old_capacity))
+        return arrays
+
+    def _entries(self):
+        """
+        Yield each node, walking the buckets and chains lazily. Raise RuntimeError if a key is added
+        or removed, or the table is resized or cleared, while iterating. A running progressive
+        rehash is paused until the iteration ends, and its old buckets are walked after the new
+        ones.
+        """
+        version = self._version
+        self._iterators += 1
+        try:
+            for buckets, start, end in self._arrays():
+                for i in range(start, end):
+                    if buckets[i] is None:
+                        continue
+                    for node in buckets[i]:
+                        if self._version != version:
+                            raise RuntimeError("HashMap changed during iteration")
+                        yield node
+            if self._version != version:
+                raise RuntimeError("HashMap changed during iteration")
+        finally:
+            self._iterators -= 1
+
+    def keys(self):
+        """
+        Return a generator over the keys in the hash table, without copying them.
+        """
+        return (entry.key for entry in self._entries())
+
+    def values(self):
+        """
+        Return a generator over the values in the hash table, without copying them.
+        """
+        return (entry.value for entry in self._entries())
+
+    def items(self):
+        """
+        Return a generator over the (key, value) pairs in the hash table, without copying them.
+        """
+        return ((entry.key, entry.value) for entry in self._entries())
+
+    def __iter__(self):
+        """
+        Iterate over the keys in the hash table.
+        """
+        return self.keys()
+
+    def __len__(self) -> int:
+        """
+        Return size of map.
+        """
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Support the in operator for keys.
+        """
+        return self.contains_key(key)
+
+    def put_many(self, pairs) -> None:
+        """
+        Put every (key, value) pair from an iterable. The hash table is grown at most once, up front,
+        for the final count, and all keys are hashed in one batch.
+        """
+        pairs = list(pairs)
+        hashes = hash_many([pair[0] for pair in pairs], self._hash_function)
+
+        # Size for the case where every key is new
+        self._reserve(self._size + len(pairs))
+        buckets, capacity = self._buckets, self._capacity
+        record = None if self._stats is None else self._stats.put_probes.record
+        for (key, value), hash in zip(pairs, hashes):
+            if self._old_buckets is not None:
+                bucket = self._step_chain(hash)
+            else:
+                bucket = buckets[hash % capacity]
+            matching_key = bucket.contains(key, hash, record)
+            if matching_key is not None:
+                matching_key.value = value
+            else:
+                bucket.insert(key, value, hash)
+                self._size += 1
+                self._version += 1
+                if self._stats is not None:
+                    self._count_chain(bucket, hash, True)
+
+    def _step_chain(self, hash: int) -> LinkedList:
+        """
+        Move the next buckets of a running progressive rehash, as a single-key operation would, and
+        return the chain for the given hash code. Batches use this while a rehash is running.
+        """
+        if self._iterators == 0:
+            self._migrate(self._rehash_step)
+        return self._chain(hash)
+
+    def get_many(self, keys) -> list:
+        """
+        Return a list with the value of each key in an iterable, or None for missing keys.
+        """
+        keys = list(keys)
+        buckets, capacity = self._buckets, self._capacity
+        record = None if self._stats is None else self._stats.get_probes.record
+        values = []
+        for key, hash in zip(keys, hash_many(keys, self._hash_function)):
+            if self._old_buckets is not None:
+                bucket = self._step_chain(hash)
+            else:
+                bucket = buckets[hash % capacity]
+            matching_key = bucket.contains(key, hash, record)
+            values.append(None if matching_key is None else matching_key.value)
+        return values
+
+    def remove_many(self, keys) -> None:
+        """
+        Remove every key in an iterable. The hash table is shrunk at most once, at the end.
+        """
+        keys = list(keys)
+        buckets, capacity = self._buckets, self._capacity
+        for key, hash in zip(keys, hash_many(keys, self._hash_function)):
+            if self._old_buckets is not None:
+                bucket = self._step_chain(hash)
+            else:
+                bucket = buckets[hash % capacity]
+            if bucket.remove(key, hash):
+                self._size -= 1
+                self._version += 1
+                if self._stats is not None:
+                    self._count_chain(bucket, hash, False)
+        self._shrink()
+
+    @classmethod
+    def from_dict(cls, mapping, function, load_factor: float = None, **options) -> "HashMap":
+        """
+        Return a new HashMap holding every key/value pair of a mapping.
+        See from_pairs for load_factor and options.
+        """
+        return cls._build(list(mapping.items()), function, load_factor, options, unique=True)
+
+    @classmethod
+    def from_pairs(cls, pairs, function, load_factor: float = None, **options) -> "HashMap":
+        """
+        Return a new HashMap holding every (key, value) pair of an iterable; later pairs win for
+        repeated keys. The capacity is computed once for the target load_factor (the resize policy's
+        high watermark by default, and never above it) and the buckets are filled directly, without
+        put(). options are passed on to the constructor.
+        """
+        return cls._build(list(pairs), function, load_factor, options, unique=False)
+
+    @classmethod
+    def from_arrays(cls, keys: DynamicArray, values: DynamicArray, function,
+                    load_factor: float = None, **options) -> "HashMap":
+        """
+        Return a new HashMap pairing each key of one DynamicArray with the value at the same index
+        of another. See from_pairs for load_factor and options.
+        """
+        if keys.length() != values.length():
+            raise ValueError("keys and values must have the same length")
+        pairs = [(keys[i], values[i]) for i in range(keys.length())]
+        return cls._build(pairs, function, load_factor, options, unique=False)
+
+    @classmethod
+    def _build(cls, pairs: list, function, load_factor: float, options: dict, unique: bool) -> "HashMap":
+        """
+        Return a new HashMap sized for pairs and filled with them.
+        """
+        m = cls(1, function, **options)
+        if load_factor is None:
+            capacity = m._policy.capacity_for(len(pairs))
+        else:
+            capacity = int(len(pairs) / load_factor) + 1
+
+        # Size through _rehash, not resize_table, so the map can still shrink to its initial capacity
+        capacity = m._policy.grow_capacity(len(pairs), capacity) or capacity
+        m._rehash(capacity)
+
+        hashes = hash_many([pair[0] for pair in pairs], function)
+        buckets, capacity = m._buckets, m._capacity
+        for (key, value), hash in zip(pairs, hashes):
+            bucket = buckets[hash % capacity]
+
+            # Keys of a mapping are unique, so only pairs need checking for duplicates
+            matching_key = None if unique else bucket.contains(key, hash)
+            if matching_key is not None:
+                matching_key.value = value
+            else:
+                bucket.insert(key, value, hash)
+                m._size += 1
+
+        if m._stats is not None:
+            m._stats.count_chains(buckets[i].length() for i in range(capacity))
+        return m
+
+    def get_stats(self) -> dict:
+        """
+        Return a snapshot of the map's statistics as a dict, or None if it was created without
+        stats. Every counter is kept up to date as the map changes, so this is O(1).
+        """
+        if self._stats is None:
+            return None
+
+        snapshot = self._stats.snapshot()
+        snapshot.update(size=self._size, capacity=self._capacity, load=self._size / self._capacity,
+                        empty_buckets=self.empty_buckets(),
+                        chains=self._stats.chain_snapshot(self._size))
+        return snapshot
+
+
+def _increment(count: int) -> int:
+    """Return count plus one, for counting with HashMap.update."""
+    return count + 1
+
 
 def find_mode(da: DynamicArray) -> (DynamicArray, int):
     """
@@ -200,37 +675,25 @@ def find_mode(da: DynamicArray) -> (DynamicArray, int):
     """
 
     # Initialize hash map, mode array, and mode frequency counter
-    map = HashMap(da.length() // 3, hash_function_1)
+    map = HashMap(max(1, da.length() // 3), hash_function_1)
     mode_array = DynamicArray()
     mode_frequency = 0
 
-    # Build hashmap with unique array values as keys. Increment value, which represents frequency, when duplicate keys
-    # are found.
-
+    # Build hashmap with unique array values as keys. Each value (frequency) is incremented in place
+    # with a single hash computation and chain walk per element.
     for i in range(da.length()):
-
-        # Find value of key being evaluated
-        current_frequency = map.get(da[i])
-
-        # If this is the first instance of a key, add to hash map.
-        if current_frequency is None:
-            map.put(da[i], 1)
-            current_frequency = 1
-
-        # If this is a duplicate value, increase value (frequency) in hash map
-        else:
-            current_frequency += 1
-            map.put(da[i], current_frequency)
+        value = da[i]
+        current_frequency = map.update(value, _increment, 0)
 
         # If current value (frequency) of key is greater than mode counter, update counter and mode array.
         if current_frequency > mode_frequency:
             mode_array = DynamicArray()
-            mode_array.append(da[i])
+            mode_array.append(value)
             mode_frequency = current_frequency
 
         # If multiple keys share a high value, add key to mode array
         elif current_frequency == mode_frequency:
-            mode_array.append(da[i])
+            mode_array.append(value)
 
     # Return mode array and frequency counter as tuple
     return mode_array, mode_frequency
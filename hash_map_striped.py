@@ -0,0 +1,285 @@
+# Description: Implement a thread-safe hash map with chaining and lock
+#              striping. Buckets are guarded by a fixed set of stripe locks,
+#              writers lock only the stripe their key hashes to, resizing and
+#              clearing take every stripe, and reads take no lock at all.
+
+
+import threading
+
+from a6_include import (DynamicArray, LinkedList,
+                        hash_function_1, hash_function_2)
+from resize_policy import ResizePolicy
+
+
+class HashMap:
+    def __init__(self, capacity: int, function, stripes: int = 16, policy: ResizePolicy = None) -> None:
+        """
+        Initialize new thread-safe HashMap that uses separate chaining for collision resolution.
+        The capacity is rounded up to a multiple of stripes, so that every bucket belongs to the
+        stripe hash % stripes at any capacity. policy works as in hash_map_sc.HashMap.
+        """
+        if policy is None:
+            policy = ResizePolicy(1.0, 0.25)
+        capacity = self._round_capacity(capacity, stripes)
+
+        self._buckets = self._new_buckets(capacity)
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._stripe_sizes = [0] * stripes
+
+        self._capacity = capacity
+        self._hash_function = function
+        self._policy = policy
+        self._min_capacity = capacity
+        self._stripes = stripes
+
+    @staticmethod
+    def _round_capacity(capacity: int, stripes: int) -> int:
+        """Return the smallest positive multiple of stripes that is >= capacity."""
+        return max(1, -(-capacity // stripes)) * stripes
+
+    @staticmethod
+    def _new_buckets(capacity: int) -> DynamicArray:
+        """Return a bucket array of empty chains."""
+        return DynamicArray([LinkedList() for _ in range(capacity)])
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        buckets = self._buckets
+        for i in range(buckets.length()):
+            out += str(i) + ': ' + str(buckets[i]) + '\n'
+        return out
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return sum(self._stripe_sizes)
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _lock_all(self) -> None:
+        """Acquire every stripe lock, always in the same order."""
+        for lock in self._locks:
+            lock.acquire()
+
+    def _unlock_all(self) -> None:
+        """Release every stripe lock."""
+        for lock in reversed(self._locks):
+            lock.release()
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Update key/value pair in hash map. If key doesn't exist, add it to hash map, then grow the
+        hash table if its load factor reached the resize policy's high watermark.
+        """
+        hash = self._hash_function(key)
+        stripe = hash % self._stripes
+
+        with self._locks[stripe]:
+            bucket = self._buckets[hash % self._capacity]
+            matching_key = bucket.contains(key, hash)
+            if matching_key is not None:
+                matching_key.value = value
+                return
+            bucket.insert(key, value, hash)
+            self._stripe_sizes[stripe] += 1
+
+        self._grow()
+
+    def update(self, key: str, function, default: object = None) -> object:
+        """
+        Atomically replace the value of given key with function(value), or add the key with
+        function(default) if it doesn't exist. Return the new value.
+        """
+        hash = self._hash_function(key)
+        stripe = hash % self._stripes
+
+        with self._locks[stripe]:
+            bucket = self._buckets[hash % self._capacity]
+            matching_key = bucket.contains(key, hash)
+            if matching_key is not None:
+                matching_key.value = function(matching_key.value)
+                return matching_key.value
+            value = function(default)
+            bucket.insert(key, value, hash)
+            self._stripe_sizes[stripe] += 1
+
+        self._grow()
+        return value
+
+    def get(self, key: str) -> object:
+        """
+        Return value associated with given key, without locking. Resizes build new chains instead
+        of relinking the old ones, so a reader holding the previous bucket array still sees a
+        consistent table.
+        """
+        hash = self._hash_function(key)
+        buckets = self._buckets
+        matching_key = buckets[hash % buckets.length()].contains(key, hash)
+        if matching_key is not None:
+            return matching_key.value
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        If key exists, return True. Else, return False. Takes no lock.
+        """
+        hash = self._hash_function(key)
+        buckets = self._buckets
+        return buckets[hash % buckets.length()].contains(key, hash) is not None
+
+    def remove(self, key: str) -> None:
+        """
+        Remove given key and associated value from hash map, then shrink the hash table if its
+        load factor dropped below the resize policy's low watermark.
+        """
+        hash = self._hash_function(key)
+        stripe = hash % self._stripes
+
+        with self._locks[stripe]:
+            if not self._buckets[hash % self._capacity].remove(key, hash):
+                return
+            self._stripe_sizes[stripe] -= 1
+
+        self._shrink()
+
+    def table_load(self) -> float:
+        """
+        Return current hash table load factor.
+        """
+        return self.get_size() / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns number of empty buckets in hash table.
+        """
+        buckets = self._buckets
+        return sum(1 for i in range(buckets.length()) if buckets[i].length() == 0)
+
+    def _grow(self) -> None:
+        """
+        Grow the hash table under every stripe lock if the resize policy requires it. The check
+        is repeated once the locks are held, since another thread may have resized already.
+        """
+        if self._policy.grow_capacity(self.get_size(), self._capacity) is None:
+            return
+        self._lock_all()
+        try:
+            new_capacity = self._policy.grow_capacity(self.get_size(), self._capacity)
+            if new_capacity is not None:
+                self._rehash(self._round_capacity(new_capacity, self._stripes))
+        finally:
+            self._unlock_all()
+
+    def _shrink(self) -> None:
+        """
+        Shrink the hash table under every stripe lock if the resize policy requires it.
+        """
+        if self._policy.shrink_capacity(self.get_size(), self._capacity, self._min_capacity) is None:
+            return
+        self._lock_all()
+        try:
+            new_capacity = self._policy.shrink_capacity(self.get_size(), self._capacity, self._min_capacity)
+            if new_capacity is not None:
+                self._rehash(self._round_capacity(new_capacity, self._stripes))
+        finally:
+            self._unlock_all()
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Change capacity of hash table, rounded up to a multiple of the stripe count, and rehash all
+        existing key/value pairs. The map will not shrink below the new capacity.
+        """
+
+        # Control for invalid new_capacity
+        if new_capacity < 1:
+            return
+
+        self._lock_all()
+        try:
+            self._min_capacity = self._round_capacity(new_capacity, self._stripes)
+            self._rehash(self._min_capacity)
+        finally:
+            self._unlock_all()
+
+    def _rehash(self, new_capacity: int) -> None:
+        """
+        Copy every key/value pair into new chains of a new bucket array, then publish it with a
+        single assignment. The old chains are left untouched for lock-free readers still walking
+        them. Must be called with every stripe lock held.
+        """
+        new_buckets = self._new_buckets(new_capacity)
+        old_buckets = self._buckets
+        for i in range(old_buckets.length()):
+            for node in old_buckets[i]:
+                new_buckets[node.hash % new_capacity].insert(node.key, node.value, node.hash)
+
+        self._buckets = new_buckets
+        self._capacity = new_capacity
+
+    def clear(self) -> None:
+        """
+        Clear hash map of all contents.
+        """
+        self._lock_all()
+        try:
+            self._buckets = self._new_buckets(self._capacity)
+            self._stripe_sizes = [0] * self._stripes
+        finally:
+            self._unlock_all()
+
+    def get_keys(self) -> DynamicArray:
+        """
+        Return a dynamic array with all keys from hashmap, read from a snapshot of the bucket array
+        """
+        key_array = DynamicArray()
+        buckets = self._buckets
+        for i in range(buckets.length()):
+            for node in buckets[i]:
+                key_array.append(node.key)
+        return key_array
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nconcurrent put example")
+    print("----------------------")
+    m = HashMap(10, hash_function_2)
+
+    def writer(start: int) -> None:
+        """Put 1000 keys starting at key start."""
+        for i in range(start, start + 1000):
+            m.put('key' + str(i), i)
+
+    threads = [threading.Thread(target=writer, args=(n * 1000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(m.get_size(), m.get_capacity(), all(m.get('key' + str(i)) == i for i in range(4000)))
+
+    print("\nconcurrent counter example")
+    print("--------------------------")
+    m = HashMap(10, hash_function_1)
+
+    def counter() -> None:
+        """Count 2000 words spread over 7 keys."""
+        for i in range(2000):
+            m.update('word' + str(i % 7), lambda count: count + 1, 0)
+
+    threads = [threading.Thread(target=counter) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(m.get_size(), sorted(m.get(key) for key in ['word' + str(i) for i in range(7)]))
@@ -0,0 +1,139 @@
+# Description: An asyncio client for kv_server. Requests from any number of
+#              concurrent coroutines share one connection: they are queued,
+#              written together once per event-loop tick and matched to their
+#              responses by id, so calls pipeline without waiting for each
+#              other's round trips. At most max_in_flight requests are
+#              outstanding at once; further calls wait for a slot.
+
+import asyncio
+import json
+
+from kv_server import DEFAULT_PORT, MAX_LINE_LENGTH
+
+
+class ServerError(Exception):
+    """The server could not execute a request."""
+
+
+class KVClient:
+    """Pipelining client for one kv_server connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 max_in_flight: int = 1024) -> None:
+        """Initialize client over an open connection; use KVClient.connect to open one."""
+        self._reader = reader
+        self._writer = writer
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._pending = {}
+        self._outgoing = []
+        self._flushed = None
+        self._next_id = 0
+        self._receiver = asyncio.get_running_loop().create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                      max_in_flight: int = 1024) -> "KVClient":
+        """Open a connection to a kv_server and return a client for it."""
+
+        # Responses to bulk requests are single lines as long as the server accepts
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE_LENGTH)
+        return cls(reader, writer, max_in_flight)
+
+    async def _receive(self) -> None:
+        """Resolve pending requests as their responses arrive; fail them all if the connection drops."""
+        error = ConnectionError("connection closed")
+        try:
+            async for line in self._reader:
+                response = json.loads(line)
+                future = self._pending.pop(response['id'], None)
+                if future is None or future.done():
+                    continue
+                if 'error' in response:
+                    future.set_exception(ServerError(response['error']))
+                else:
+                    future.set_result(response['result'])
+        except Exception as exception:
+            error = exception
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    def _flush(self) -> None:
+        """Write every request queued during this event-loop tick in one call."""
+        self._writer.write(b''.join(self._outgoing))
+        self._outgoing.clear()
+        if not self._flushed.done():
+            self._flushed.set_result(None)
+
+    async def call(self, op: str, *args) -> object:
+        """Send one request and return its result. Raise ServerError if the server reports an error."""
+        async with self._slots:
+            if self._receiver.done():
+                raise ConnectionError("connection closed")
+            request_id = self._next_id
+            self._next_id += 1
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+
+            if not self._outgoing:
+                self._flushed = asyncio.get_running_loop().create_future()
+                asyncio.get_running_loop().call_soon(self._flush)
+            flushed = self._flushed
+            self._outgoing.append(json.dumps({'id': request_id, 'op': op, 'args': args},
+                                             separators=(',', ':')).encode('utf-8') + b'\n')
+
+            # Wait for the request to be written, so drain applies backpressure to its batch. The
+            # future is shared by the batch, so one caller's cancellation must not cancel it.
+            await asyncio.shield(flushed)
+            await self._writer.drain()
+            return await future
+
+    async def put(self, key: str, value: object) -> None:
+        """Update key/value pair in the remote map."""
+        await self.call('put', key, value)
+
+    async def get(self, key: str) -> object:
+        """Return value associated with given key, or None."""
+        return await self.call('get', key)
+
+    async def remove(self, key: str) -> None:
+        """Remove given key and associated value from the remote map."""
+        await self.call('remove', key)
+
+    async def contains_key(self, key: str) -> bool:
+        """If key exists, return True. Else, return False."""
+        return await self.call('contains_key', key)
+
+    async def get_size(self) -> int:
+        """Return size of the remote map."""
+        return await self.call('get_size')
+
+    async def put_many(self, pairs) -> None:
+        """Put every (key, value) pair from an iterable in one request."""
+        await self.call('put_many', [list(pair) for pair in pairs])
+
+    async def get_many(self, keys) -> list:
+        """Return a list with the value of each key, or None for missing keys, in one request."""
+        return await self.call('get_many', list(keys))
+
+    async def remove_many(self, keys) -> None:
+        """Remove every key in an iterable in one request."""
+        await self.call('remove_many', list(keys))
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._receiver
+
+    async def __aenter__(self) -> "KVClient":
+        """Return the client itself, so it can be used in an async with statement."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the connection on leaving an async with statement."""
+        await self.close()
@@ -0,0 +1,109 @@
+# Description: An asyncio TCP key-value server over a HashMap. The protocol is
+#              JSON lines: each request is one object
+#
+#                  {"id": 7, "op": "put", "args": ["key", "value"]}
+#
+#              answered by {"id": 7, "result": ...} or {"id": 7, "error": "..."}.
+#              Requests can be pipelined: the server answers every complete
+#              line of a read with one batched write, in request order, and
+#              waits for the socket to drain before reading more, so a client
+#              that stops reading is throttled by TCP flow control.
+
+import argparse
+import asyncio
+import json
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import hash_function_2
+
+# Operations clients may call, with the HashMap methods they map to
+OPERATIONS = ('put', 'get', 'remove', 'contains_key', 'get_size',
+              'put_many', 'get_many', 'remove_many')
+
+DEFAULT_PORT = 7878
+READ_SIZE = 65_536
+MAX_LINE_LENGTH = 16 * 1024 * 1024
+
+
+class KVServer:
+    """Serve one HashMap to any number of concurrent connections."""
+
+    def __init__(self, m) -> None:
+        """Initialize server for a hash_map_sc or hash_map_oa HashMap."""
+        self._map = m
+        self._operations = {op: getattr(m, op) for op in OPERATIONS}
+
+    def _respond(self, line: bytes) -> bytes:
+        """Execute one request line and return its response line."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            request_id = request.get('id')
+            operation = self._operations.get(request.get('op'))
+            if operation is None:
+                raise ValueError(f"unknown operation {request.get('op')!r}")
+            response = {'id': request_id, 'result': operation(*request.get('args', ()))}
+        except Exception as error:
+            response = {'id': request_id, 'error': f"{type(error).__name__}: {error}"}
+        return json.dumps(response, separators=(',', ':')).encode('utf-8') + b'\n'
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one connection. Every complete line received in one read is answered by one write,
+        and the next read waits until the written responses have drained.
+        """
+        partial = b''
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                lines = (partial + data).split(b'\n')
+                partial = lines.pop()
+                if len(partial) > MAX_LINE_LENGTH:
+                    writer.write(b'{"id":null,"error":"ValueError: request line too long"}\n')
+                    break
+
+                writer.write(b''.join([self._respond(line) for line in lines if line.strip()]))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Start listening and return the asyncio server."""
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def serve(m, host: str = '127.0.0.1', port: int = DEFAULT_PORT) -> None:
+    """Serve a HashMap until cancelled."""
+    server = await KVServer(m).start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    """Serve a HashMap on the host and port given on the command line."""
+    parser = argparse.ArgumentParser(description='Serve a HashMap over TCP.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--map', choices=('sc', 'oa'), default='sc')
+    args = parser.parse_args()
+
+    module = hash_map_sc if args.map == 'sc' else hash_map_oa
+    try:
+        asyncio.run(serve(module.HashMap(64, hash_function_2), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# Description: Opt-in statistics for the HashMap implementations. A map
+#              created with stats=True feeds a MapStats with the probes of
+#              each get and put, the length changes of its chains and the
+#              resizes it performs. Every counter is maintained as it
+#              changes, so a snapshot costs the same at any map size.
+
+# Probe histograms count 0, 1, ... PROBE_BUCKETS - 2 probes exactly; the last
+# bucket counts everything longer
+PROBE_BUCKETS = 32
+
+
+class ProbeHistogram:
+    """
+    Histogram of probes per operation. Recording only increments one bucket;
+    the count, mean and maximum are derived from the buckets when read.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._buckets = [0] * (PROBE_BUCKETS - 1)
+        self._long = 0
+        self._long_total = 0
+        self._long_max = 0
+
+    def record(self, probes: int) -> None:
+        """Count one operation that took the given number of probes."""
+        try:
+            self._buckets[probes] += 1
+        except IndexError:
+            self._long += 1
+            self._long_total += probes
+            self._long_max = max(self._long_max, probes)
+
+    def snapshot(self) -> dict:
+        """Return the histogram with its count, mean and maximum as a dict."""
+        count = sum(self._buckets) + self._long
+        total = sum(probes * n for probes, n in enumerate(self._buckets)) + self._long_total
+        longest = max((probes for probes, n in enumerate(self._buckets) if n), default=0)
+        return {'count': count,
+                'mean': total / count if count else 0.0,
+                'max': max(longest, self._long_max),
+                'histogram': self._buckets + [self._long]}
+
+
+class MapStats:
+    """
+    Counters of one HashMap. Chain lengths are tracked as a histogram of
+    chain counts by length, so the longest chain and the number of non-empty
+    chains stay current as keys come and go.
+    """
+
+    def __init__(self) -> None:
+        """Initialize zeroed counters for an empty map."""
+        self.get_probes = ProbeHistogram()
+        self.put_probes = ProbeHistogram()
+        self.resizes = 0
+        self.resize_seconds = 0.0
+
+        self._chains = [0]
+        self._nonempty_chains = 0
+        self._max_chain = 0
+
+    def resized(self, seconds: float) -> None:
+        """Count one resize that took the given time."""
+        self.resizes += 1
+        self.resize_seconds += seconds
+
+    def chain_grew(self, length: int) -> None:
+        """Record that a chain grew by one to length."""
+        if length == len(self._chains):
+            self._chains.append(0)
+        self._chains[length] += 1
+        if length == 1:
+            self._nonempty_chains += 1
+        else:
+            self._chains[length - 1] -= 1
+        if length > self._max_chain:
+            self._max_chain = length
+
+    def chain_shrank(self, length: int) -> None:
+        """Record that a chain shrank by one to length."""
+        self._chains[length + 1] -= 1
+        if length == 0:
+            self._nonempty_chains -= 1
+        else:
+            self._chains[length] += 1
+        while self._max_chain > 0 and self._chains[self._max_chain] == 0:
+            self._max_chain -= 1
+
+    def chain_emptied(self, length: int) -> None:
+        """Record that a chain of the given length was emptied at once."""
+        self._chains[length] -= 1
+        self._nonempty_chains -= 1
+        while self._max_chain > 0 and self._chains[self._max_chain] == 0:
+            self._max_chain -= 1
+
+    def count_chains(self, lengths) -> None:
+        """Recount the chain histogram from the length of every chain, after a rehash or clear."""
+        self._chains = [0]
+        self._nonempty_chains = 0
+        self._max_chain = 0
+        for length in lengths:
+            if length == 0:
+                continue
+            while length >= len(self._chains):
+                self._chains.append(0)
+            self._chains[length] += 1
+            self._nonempty_chains += 1
+        self._max_chain = len(self._chains) - 1
+
+    def nonempty_chains(self) -> int:
+        """Return number of chains holding at least one key."""
+        return self._nonempty_chains
+
+    def snapshot(self) -> dict:
+        """Return the probe and resize counters as a dict."""
+        return {'get_probes': self.get_probes.snapshot(),
+                'put_probes': self.put_probes.snapshot(),
+                'resizes': self.resizes,
+                'resize_seconds': self.resize_seconds}
+
+    def chain_snapshot(self, size: int) -> dict:
+        """Return the chain length counters of a map holding size keys as a dict."""
+        return {'max': self._max_chain,
+                'mean': size / self._nonempty_chains if self._nonempty_chains else 0.0,
+                'nonempty': self._nonempty_chains}
@@ -0,0 +1,107 @@
+# Description: Probe sequences for the open addressing HashMap. Each strategy
+#              picks the table capacities it supports and yields bucket
+#              indices for a key, visiting every bucket exactly once. A
+#              strategy may need a step per key besides its hash code, which
+#              maps can cache through step().
+
+from a6_include import hash_function_2
+from hash_functions import HASH_MASK, MIX_MULTIPLIER_2
+
+
+def next_power_of_two(capacity: int) -> int:
+    """Return the smallest power of two that is >= capacity (and at least 1)."""
+    power = 1
+    while power < capacity:
+        power *= 2
+    return power
+
+
+class LinearProbing:
+    """
+    Probe hash, hash + 1, hash + 2, ... wrapping around the table.
+    Visits every bucket for any capacity.
+    """
+
+    def table_capacity(self, capacity: int) -> int:
+        """Return the capacity to allocate for a requested capacity."""
+        return max(1, capacity)
+
+    def step(self, hash: int, key: str) -> None:
+        """Return None: the sequence needs nothing besides the hash code."""
+        return None
+
+    def probe(self, hash: int, key: str, capacity: int, step: int = None):
+        """Yield every bucket index of the table, starting at the key's home bucket."""
+        index = hash % capacity
+        for _ in range(capacity):
+            yield index
+            index += 1
+            if index == capacity:
+                index = 0
+
+
+class QuadraticProbing:
+    """
+    Probe hash + 0, hash + 1, hash + 3, hash + 6, ... (triangular numbers).
+    Capacities are rounded up to a power of two, which makes the sequence
+    visit every bucket exactly once.
+    """
+
+    def table_capacity(self, capacity: int) -> int:
+        """Return the capacity to allocate for a requested capacity."""
+        return next_power_of_two(capacity)
+
+    def step(self, hash: int, key: str) -> None:
+        """Return None: the sequence needs nothing besides the hash code."""
+        return None
+
+    def probe(self, hash: int, key: str, capacity: int, step: int = None):
+        """Yield every bucket index of the table, starting at the key's home bucket."""
+        mask = capacity - 1
+        index = hash & mask
+        for i in range(1, capacity + 1):
+            yield index
+            index = (index + i) & mask
+
+
+class DoubleHashing:
+    """
+    Probe hash, hash + step, hash + 2 * step, ... where step comes from a
+    second hash function (hash_function_2 by default). Capacities are rounded
+    up to a power of two and the step is forced odd, so it is coprime with the
+    capacity and the sequence visits every bucket exactly once.
+
+    The open addressing map caches each entry's step next to its hash code,
+    so resizes move entries without hashing any key again; only operations
+    given a key call the step function. With step_function=None the step
+    comes from the high bits of a multiplicative scramble of the hash code
+    instead, which saves that call, but keys whose hash codes are equal then
+    share their whole probe sequence.
+    """
+
+    def __init__(self, step_function=hash_function_2) -> None:
+        """Initialize strategy with the hash function used to compute the step, or None."""
+        self._step_function = step_function
+
+    def table_capacity(self, capacity: int) -> int:
+        """Return the capacity to allocate for a requested capacity."""
+        return next_power_of_two(capacity)
+
+    def step(self, hash: int, key: str) -> int:
+        """Return the step of the probe sequence for a key with the given hash code."""
+        if self._step_function is None:
+            return (((hash * MIX_MULTIPLIER_2) & HASH_MASK) >> 32) | 1
+        return self._step_function(key) | 1
+
+    def probe(self, hash: int, key: str, capacity: int, step: int = None):
+        """
+        Yield every bucket index of the table, starting at the key's home bucket. step is the
+        key's step if already known; otherwise it is computed.
+        """
+        mask = capacity - 1
+        index = hash & mask
+        if step is None:
+            step = self.step(hash, key)
+        for _ in range(capacity):
+            yield index
+            index = (index + step) & mask
@@ -0,0 +1,49 @@
+# Description: Load factor watermarks shared by the HashMap implementations to
+#              decide when a table grows or shrinks.
+
+
+class ResizePolicy:
+    """
+    Decide when a hash map grows or shrinks based on its load factor.
+    A map grows before adding an entry once the load factor reaches grow_at,
+    and shrinks after a removal once it drops below shrink_at (None never
+    shrinks). Capacities change by growth_factor at a time.
+    """
+
+    def __init__(self, grow_at: float, shrink_at: float = None, growth_factor: int = 2) -> None:
+        """Initialize policy with high and low load factor watermarks."""
+        if shrink_at is not None and shrink_at * growth_factor >= grow_at:
+            raise ValueError("shrink_at * growth_factor must be below grow_at")
+        self.grow_at = grow_at
+        self.shrink_at = shrink_at
+        self.growth_factor = growth_factor
+
+    def grow_capacity(self, size: int, capacity: int) -> int:
+        """
+        Return the capacity to grow to before adding an entry to a map holding size entries,
+        or None if the map does not need to grow.
+        """
+        if size / capacity < self.grow_at:
+            return None
+        while size / capacity >= self.grow_at:
+            capacity *= self.growth_factor
+        return capacity
+
+    def shrink_capacity(self, size: int, capacity: int, min_capacity: int) -> int:
+        """
+        Return the capacity to shrink to after removing an entry, never going below
+        min_capacity, or None if the map does not need to shrink.
+        """
+        if self.shrink_at is None:
+            return None
+        new_capacity = capacity
+        while new_capacity // self.growth_factor >= max(1, min_capacity) and \
+                size / new_capacity < self.shrink_at:
+            new_capacity //= self.growth_factor
+        if new_capacity == capacity:
+            return None
+        return new_capacity
+
+    def capacity_for(self, size: int) -> int:
+        """Return the smallest capacity that holds size entries below the grow_at watermark."""
+        return int(size / self.grow_at) + 1
@@ -0,0 +1,250 @@
+# Description: A hash map partitioned by hash across several shards whose
+#              storage lives in multiprocessing.shared_memory, so any number
+#              of reader processes can serve get and contains_key straight
+#              from the shared pages without copying or pickling the table.
+#
+#              Writes go through the owning ShardedHashMap, which keeps each
+#              shard as an open addressing HashMap. publish() writes every
+#              changed shard to a new flat table segment and swaps it in
+#              through a small control segment; readers notice the new
+#              generation on their next lookup and attach to it.
+
+import struct
+from multiprocessing import shared_memory
+
+from flat_table import FlatTable, encode_map, hash_fingerprint
+from hash_functions import HASH_MASK, MIX_MULTIPLIER_1
+from hash_map_oa import HashMap
+
+CONTROL_MAGIC = b'HMSHARD2'
+# Magic, shard count, hash function name and fingerprint
+CONTROL_HEADER = struct.Struct('<8sQ32sQ')
+# Per shard: generation (odd while being updated) and the name of its segment
+SHARD_RECORD = struct.Struct('<Q48s')
+
+
+def shard_index(hash: int, shards: int) -> int:
+    """
+    Return the shard of a hash code. The shard comes from the high bits of a multiplicative
+    scramble, so the low bits that pick a slot within a shard's table stay evenly spread.
+    """
+    return (((hash * MIX_MULTIPLIER_1) & HASH_MASK) * shards) >> 64
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing segment without letting this process's resource tracker unlink it at
+    exit. Before Python 3.13 tracking can't be turned off, so readers should be child processes
+    of the writer, which share its resource tracker.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class ShardedHashMap:
+    """
+    Writer side of a sharded shared-memory hash map. Reads and writes on the
+    writer see changes immediately; readers see them after publish().
+    """
+
+    def __init__(self, shards: int, function, name: str = None) -> None:
+        """
+        Initialize an empty map of the given number of shards, hashed by function, and publish it.
+        function must give the same hash codes in every process (not the built-in hash, unless
+        readers are forked from the writer); readers check this against a fingerprint of its hash
+        codes. name names the control segment readers attach to.
+        """
+        self._shards = [HashMap(64, function) for _ in range(shards)]
+        self._segments = [None] * shards
+        self._dirty = [True] * shards
+        self._generations = [0] * shards
+        self._hash_function = function
+
+        self._control = shared_memory.SharedMemory(
+            name=name, create=True, size=CONTROL_HEADER.size + shards * SHARD_RECORD.size)
+        CONTROL_HEADER.pack_into(self._control.buf, 0, CONTROL_MAGIC, shards,
+                                 function.__name__.encode('utf-8'), hash_fingerprint(function))
+        self.publish()
+
+    @property
+    def name(self) -> str:
+        """Name of the control segment, to pass to ShardedReader."""
+        return self._control.name
+
+    def _shard(self, key: str) -> int:
+        """Return index of the shard owning key."""
+        return shard_index(self._hash_function(key) & HASH_MASK, len(self._shards))
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return sum(shard.get_size() for shard in self._shards)
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Update key/value pair in the owning shard. Readers see it after the next publish().
+        """
+        shard = self._shard(key)
+        self._shards[shard].put(key, value)
+        self._dirty[shard] = True
+
+    def remove(self, key: str) -> None:
+        """
+        Remove given key and associated value from the owning shard.
+        """
+        shard = self._shard(key)
+        if self._shards[shard].contains_key(key):
+            self._shards[shard].remove(key)
+            self._dirty[shard] = True
+
+    def get(self, key: str) -> object:
+        """
+        Return value associated with given key, including unpublished writes.
+        """
+        return self._shards[self._shard(key)].get(key)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        If key exists, return True. Else, return False.
+        """
+        return self._shards[self._shard(key)].contains_key(key)
+
+    def publish(self) -> None:
+        """
+        Write every shard changed since the last publish to a new shared memory segment and make
+        readers switch to it. Old segments are unlinked; readers still mapping one keep a valid
+        view until they switch.
+        """
+        for index, shard in enumerate(self._shards):
+            if not self._dirty[index]:
+                continue
+            table = encode_map(shard)
+            segment = shared_memory.SharedMemory(create=True, size=len(table))
+            segment.buf[:len(table)] = table
+
+            # Seqlock: an odd generation tells readers the record is being rewritten
+            offset = CONTROL_HEADER.size + index * SHARD_RECORD.size
+            generation = self._generations[index]
+            SHARD_RECORD.pack_into(self._control.buf, offset, generation + 1, b'')
+            SHARD_RECORD.pack_into(self._control.buf, offset, generation + 1,
+                                   segment.name.encode('utf-8'))
+            SHARD_RECORD.pack_into(self._control.buf, offset, generation + 2,
+                                   segment.name.encode('utf-8'))
+            self._generations[index] = generation + 2
+
+            if self._segments[index] is not None:
+                self._segments[index].close()
+                self._segments[index].unlink()
+            self._segments[index] = segment
+            self._dirty[index] = False
+
+    def close(self) -> None:
+        """Unlink every shared memory segment. Attached readers keep their current views."""
+        for segment in self._segments + [self._control]:
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+        self._segments = [None] * len(self._shards)
+
+    def __enter__(self) -> "ShardedHashMap":
+        """Return the map itself, so it can be used in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the map on leaving a with statement."""
+        self.close()
+
+
+class ShardedReader:
+    """
+    Read-only view of a ShardedHashMap from any process on the machine.
+    Each lookup checks its shard's generation and reattaches after a publish.
+    """
+
+    def __init__(self, name: str, function) -> None:
+        """Attach to the map whose control segment is name; function must match the writer's."""
+        self._control = _attach(name)
+        magic, shards, function_name, fingerprint = CONTROL_HEADER.unpack_from(self._control.buf, 0)
+        if magic != CONTROL_MAGIC:
+            self._control.close()
+            raise ValueError(f"{name} is not a sharded hash map")
+        function_name = function_name.rstrip(b'\0').decode('utf-8')
+        if function_name != function.__name__:
+            self._control.close()
+            raise ValueError(f"map was written with hash function {function_name}, "
+                             f"not {function.__name__}")
+        if fingerprint != hash_fingerprint(function):
+            self._control.close()
+            raise ValueError(f"{function_name} gives different hash codes than the writer's; "
+                             f"it must not be seeded per process")
+
+        self._shard_count = shards
+        self._tables = [None] * shards
+        self._segments = [None] * shards
+        self._generations = [None] * shards
+        self._hash_function = function
+
+    def _table(self, index: int) -> FlatTable:
+        """Return the current flat table of a shard, attaching to a newly published one if needed."""
+        offset = CONTROL_HEADER.size + index * SHARD_RECORD.size
+        while True:
+            generation, name = SHARD_RECORD.unpack_from(self._control.buf, offset)
+            if generation == self._generations[index]:
+                return self._tables[index]
+            if generation % 2 == 1 or SHARD_RECORD.unpack_from(self._control.buf, offset)[0] != generation:
+                continue
+
+            try:
+                segment = _attach(name.rstrip(b'\0').decode('utf-8'))
+            except FileNotFoundError:
+                # Replaced and unlinked by another publish in the meantime
+                continue
+            self._detach(index)
+            self._tables[index] = FlatTable(segment.buf, self._hash_function)
+            self._segments[index] = segment
+            self._generations[index] = generation
+            return self._tables[index]
+
+    def _detach(self, index: int) -> None:
+        """Release a shard's table and close its segment."""
+        if self._tables[index] is not None:
+            self._tables[index].release()
+            self._segments[index].close()
+            self._tables[index] = self._segments[index] = self._generations[index] = None
+
+    def get(self, key: str) -> object:
+        """
+        Return value associated with given key
+        """
+        hash = self._hash_function(key) & HASH_MASK
+        return self._table(shard_index(hash, self._shard_count))._get(key, hash)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        If key exists, return True. Else, return False.
+        """
+        hash = self._hash_function(key) & HASH_MASK
+        return self._table(shard_index(hash, self._shard_count))._find(key, hash) is not None
+
+    def get_size(self) -> int:
+        """
+        Return size of map as of the latest publish
+        """
+        return sum(self._table(index).get_size() for index in range(self._shard_count))
+
+    def close(self) -> None:
+        """Detach from every segment."""
+        for index in range(self._shard_count):
+            self._detach(index)
+        self._control.close()
+
+    def __enter__(self) -> "ShardedReader":
+        """Return the reader itself, so it can be used in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the reader on leaving a with statement."""
+        self.close()
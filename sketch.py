@@ -0,0 +1,150 @@
+# Description: Approximate frequency counting in fixed memory. A Count-Min
+#              sketch estimates every value's count from a few rows of
+#              counters, and HeavyHitters pairs it with a small exact
+#              HashMap of the current top candidates (Space-Saving style) to
+#              answer find_mode and top-k queries over unbounded cardinality.
+
+import heapq
+import math
+from array import array
+
+from a6_include import DynamicArray, hash_function_2
+from hash_functions import make_mix_hash
+from hash_map_sc import HashMap
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch with depth rows of width counters. Estimates never
+    undercount; with width = ceil(e / epsilon) and depth = ceil(ln(1 / delta))
+    they overcount by more than epsilon * total with probability at most delta.
+    """
+
+    def __init__(self, width: int, depth: int, seed: int = 0) -> None:
+        """Initialize an empty sketch; seed selects an independent family of row hashes."""
+        self._width = width
+        self._depth = depth
+        self._hash_function = make_mix_hash(seed)
+        self._rows = [array('Q', bytes(8 * width)) for _ in range(depth)]
+        self._total = 0
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float, seed: int = 0) -> "CountMinSketch":
+        """Return a sketch sized for additive error epsilon * total with failure probability delta."""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), seed)
+
+    def _columns(self, key: str):
+        """
+        Yield the counter column of key in each row. Row hashes are derived from the two halves
+        of one seeded 64-bit hash (Kirsch-Mitzenmacher), so a key is hashed once per operation.
+        """
+        hash = self._hash_function(key)
+        low, high = hash & 0xffffffff, (hash >> 32) | 1
+        for row in range(self._depth):
+            yield (low + row * high) % self._width
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Add count occurrences of key and return its new estimated count."""
+        self._total += count
+        estimate = None
+        for row, column in zip(self._rows, self._columns(key)):
+            row[column] += count
+            if estimate is None or row[column] < estimate:
+                estimate = row[column]
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        """Return the estimated count of key."""
+        return min(row[column] for row, column in zip(self._rows, self._columns(key)))
+
+    def total(self) -> int:
+        """Return number of occurrences added."""
+        return self._total
+
+    def memory_bytes(self) -> int:
+        """Return bytes used by the counters."""
+        return sum(row.itemsize * len(row) for row in self._rows)
+
+
+class HeavyHitters:
+    """
+    Approximate heavy hitters in fixed memory: a Count-Min sketch estimates
+    every count, and a HashMap keeps the k values with the highest estimates
+    seen so far. A new value replaces the weakest candidate once its estimate
+    exceeds the candidate's.
+    """
+
+    def __init__(self, k: int, epsilon: float = 0.0001, delta: float = 0.01, seed: int = 0,
+                 function=hash_function_2) -> None:
+        """
+        Initialize tracker for k candidates, with sketch error bounds epsilon and delta.
+        function is the hash function of the candidate map.
+        """
+        self._k = k
+        self._sketch = CountMinSketch.from_error(epsilon, delta, seed)
+        self._candidates = HashMap(2 * k, function)
+        self._heap = []
+
+    def add(self, key: str, count: int = 1) -> None:
+        """Add count occurrences of key."""
+        estimate = self._sketch.add(key, count)
+
+        if key in self._candidates or self._candidates.get_size() < self._k:
+            self._candidates.put(key, estimate)
+            self._push(key, estimate)
+            return
+
+        weakest_key, weakest_estimate = self._weakest()
+        if estimate > weakest_estimate:
+            self._candidates.remove(weakest_key)
+            heapq.heappop(self._heap)
+            self._candidates.put(key, estimate)
+            self._push(key, estimate)
+
+    def consume(self, iterable) -> "HeavyHitters":
+        """Add one occurrence of every value of an iterable. Return the tracker."""
+        for key in iterable:
+            self.add(key)
+        return self
+
+    def _push(self, key: str, estimate: int) -> None:
+        """
+        Record a candidate's estimate on the min-heap. Outdated heap entries are dropped lazily;
+        when they outnumber the candidates, the heap is rebuilt so memory stays bounded.
+        """
+        heapq.heappush(self._heap, (estimate, key))
+        if len(self._heap) > 4 * self._k:
+            self._heap = [(value, key) for key, value in self._candidates.items()]
+            heapq.heapify(self._heap)
+
+    def _weakest(self) -> (str, int):
+        """Return the candidate with the lowest estimate, leaving it on top of the heap."""
+        while True:
+            estimate, key = self._heap[0]
+            if self._candidates.get(key) == estimate:
+                return key, estimate
+            heapq.heappop(self._heap)
+
+    def estimate(self, key: str) -> int:
+        """Return the estimated count of key."""
+        return self._sketch.estimate(key)
+
+    def top_k(self, k: int = None) -> list:
+        """Return up to k (value, estimated count) candidates, highest estimate first."""
+        return heapq.nlargest(k or self._k, self._candidates.items(), key=lambda item: item[1])
+
+    def mode(self) -> (DynamicArray, int):
+        """Return an array with the approximate mode value(s) and their estimated frequency."""
+        mode_array = DynamicArray()
+        mode_frequency = 0
+        for key, estimate in self._candidates.items():
+            if estimate > mode_frequency:
+                mode_array = DynamicArray()
+                mode_frequency = estimate
+            if estimate == mode_frequency:
+                mode_array.append(key)
+        return mode_array, mode_frequency
+
+    def memory_bytes(self) -> int:
+        """Return bytes used by the sketch counters (the candidate map holds at most k entries)."""
+        return self._sketch.memory_bytes()
@@ -0,0 +1,62 @@
+# Description: Save an open addressing HashMap to a binary snapshot file in
+#              the flat_table layout and reopen it read-only with mmap. An
+#              opened snapshot answers get and contains_key straight from the
+#              page cache with no deserialization step, so opening costs the
+#              same for any table size, and every process that opens the same
+#              file shares one copy of its pages.
+
+import mmap
+import os
+
+from flat_table import FlatTable, encode_map
+
+
+def save(m, path: str) -> int:
+    """
+    Write a hash_map_oa.HashMap to a snapshot file and return its size in bytes. The file is
+    written beside path and renamed over it, so readers never see a partial snapshot.
+    """
+    table = encode_map(m)
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(table)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+    return len(table)
+
+
+class Snapshot(FlatTable):
+    """A snapshot file mapped read-only into memory."""
+
+    def __init__(self, path: str, function) -> None:
+        """
+        Map the snapshot at path. function must be the hash function of the saved map; a
+        snapshot written with a differently named function, or with one whose hash codes differ
+        in this process, raises ValueError.
+        """
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            super().__init__(self._mmap, function)
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def close(self) -> None:
+        """Unmap the snapshot."""
+        self.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "Snapshot":
+        """Return the snapshot itself, so it can be used in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the snapshot on leaving a with statement."""
+        self.close()
+
+
+def load(path: str, function) -> Snapshot:
+    """Open the snapshot at path for read-only lookups."""
+    return Snapshot(path, function)